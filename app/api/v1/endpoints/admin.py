@@ -1,5 +1,5 @@
 from typing import Any, Dict, List
-from fastapi import APIRouter, Depends, Query, Body
+from fastapi import APIRouter, Depends, Query, Body, HTTPException
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.future import select
@@ -9,6 +9,9 @@ from app.models.user import User, UserRole
 from app.models.admin import AuditLog
 from app.services.admin_service import admin_service
 from app.core.permissions import verify_admin_access, verify_superadmin_access
+from app.core.http import http_clients
+from app.services.scraper.browser import browser_pool
+from app.services.job_ingest.bloom import get_seen_filter
 
 router = APIRouter()
 
@@ -22,6 +25,62 @@ async def get_system_metrics(
     """
     return await admin_service.get_system_metrics(db)
 
+@router.get("/http-pools", dependencies=[Depends(verify_admin_access)])
+async def get_http_pool_stats(
+    current_user: User = Depends(deps.get_current_user),
+) -> Dict:
+    """
+    Outbound HTTP connection pool usage for this API process.
+    """
+    return http_clients.stats()
+
+@router.get("/browser-pool", dependencies=[Depends(verify_admin_access)])
+async def get_browser_pool_stats(
+    current_user: User = Depends(deps.get_current_user),
+) -> Dict:
+    """
+    Browser context pool usage, and the requests and bytes it fetched or blocked, for this API process.
+    """
+    return browser_pool.stats()
+
+@router.get("/seen-filter", dependencies=[Depends(verify_admin_access)])
+async def get_seen_filter_stats(
+    current_user: User = Depends(deps.get_current_user),
+) -> Dict:
+    """
+    Size and false-positive rate of the job_hash seen-filter in this API process.
+    """
+    seen_filter = get_seen_filter()
+    return await seen_filter.stats() if seen_filter else {"backend": "off"}
+
+@router.post("/seen-filter/rebuild", dependencies=[Depends(verify_superadmin_access)])
+async def rebuild_seen_filter(
+    db: AsyncSession = Depends(deps.get_session),
+    current_user: User = Depends(deps.get_current_user),
+) -> Dict:
+    """
+    Rebuild the seen-filter from the job table.
+    """
+    seen_filter = get_seen_filter()
+    if not seen_filter:
+        return {"backend": "off"}
+    if not await seen_filter.rebuild(db):
+        raise HTTPException(409, "The seen-filter is already being rebuilt")
+    return await seen_filter.stats()
+
+@router.get("/ingest/stage-timings", dependencies=[Depends(verify_admin_access)])
+async def get_ingest_stage_timings(
+    hours: int = Query(24, ge=1, le=24 * 30),
+    db: AsyncSession = Depends(deps.get_session),
+    current_user: User = Depends(deps.get_current_user),
+) -> Dict:
+    """
+    p50/p95 time per ingestion stage (fetch, normalize, dedup, persist, commit) for each source,
+    plus bytes fetched, pages fetched and DB round trips per run. Unchanged (304) runs are
+    counted separately.
+    """
+    return await admin_service.get_ingest_stage_timings(db, hours)
+
 @router.get("/users", dependencies=[Depends(verify_admin_access)])
 async def list_users(
     db: AsyncSession = Depends(deps.get_session),
@@ -8,6 +8,7 @@ from app.api import deps
 from app.models.application import Application
 from app.models.user import User
 from app.schemas.application import ApplicationCreate, ApplicationRead
+from app.services.payload_store import payload_store
 
 router = APIRouter()
 
@@ -31,6 +32,7 @@ async def read_applications(
     )
     result = await db.execute(stmt)
     applications = result.scalars().all()
+    await payload_store.hydrate(db, [application.job for application in applications if application.job])
     return applications
 
 @router.post("/", response_model=ApplicationRead)
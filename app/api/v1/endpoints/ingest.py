@@ -44,7 +44,7 @@ async def trigger_ingestion(
     await db.refresh(source)
     
     # 2. Trigger Celery Task
-    task = run_ingestion_task.delay(source.id)
+    task = run_ingestion_task.delay(source.id, force_rescan=request.force_rescan)
     
     return IngestStatus(
         task_id=task.id,
@@ -6,6 +6,7 @@ from sqlalchemy.future import select
 from app.api import deps
 from app.models.job import Job
 from app.schemas.job import JobCreate, JobRead
+from app.services.payload_store import payload_store
 
 router = APIRouter()
 
@@ -17,10 +18,25 @@ async def read_jobs(
 ) -> Any:
     """
     Retrieve jobs.
+    Long descriptions and raw postings live in the payload store and are
+    left out (null) here; GET /jobs/{job_id} returns them.
     """
     result = await db.execute(select(Job).offset(skip).limit(limit))
-    jobs = result.scalars().all()
-    return jobs
+    return result.scalars().all()
+
+@router.get("/{job_id}", response_model=JobRead)
+async def read_job(
+    job_id: int,
+    db: AsyncSession = Depends(deps.get_session),
+) -> Any:
+    """
+    Retrieve a job with its full description and raw posting.
+    """
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    await payload_store.hydrate(db, [job])
+    return job
 
 @router.post("/", response_model=JobRead)
 async def create_job(
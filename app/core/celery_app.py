@@ -1,5 +1,8 @@
 import os
 from celery import Celery
+from celery.signals import worker_process_shutdown
+from app.core.http import http_clients
+from app.services.scraper.browser import browser_pool
 
 # Default to local redis if not set
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
@@ -19,8 +22,18 @@ celery_app.conf.update(
 
 celery_app.conf.imports = [
     "app.workers.job_ingest_worker",
-    "app.workers.auto_apply_worker"
+    "app.workers.auto_apply_worker",
+    "app.workers.enrichment_worker",
 ]
 
 # Auto-discover tasks in packages
 celery_app.autodiscover_tasks(["app.services.orchestrator.tasks"])
+
+@worker_process_shutdown.connect
+def _close_http_clients(**kwargs):
+    # Close pooled keep-alive connections on the worker's event loop
+    http_clients.close()
+
+@worker_process_shutdown.connect
+def _close_browser_pool(**kwargs):
+    browser_pool.close()
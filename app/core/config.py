@@ -14,6 +14,84 @@ class Settings(BaseSettings):
     # AI Service API Key (e.g. Gemini, OpenAI) - Optional for free tier mocking
     AI_API_KEY: Optional[str] = None
 
+    # Job Ingestion
+    INGEST_MAX_CONCURRENCY: int = 8 # Sources ingested at once per runner
+    INGEST_PER_HOST_CONCURRENCY: int = 2 # Sources sharing a hostname at once
+    INGEST_CHUNK_SIZE: int = 500 # Postings normalized/deduplicated/inserted per batch
+    INGEST_PROCESS_POOL_SIZE: int = 0 # Processes for the normalization stage (0 = inline)
+    INGEST_TAG_TAXONOMY_PATH: Optional[str] = None # JSON tag list or {alias: tag} map; switches to CompiledJobNormalizer
+    INGEST_BULK_LOAD: bool = False # COPY + merge instead of multi-row INSERT (Postgres/asyncpg only)
+
+    # Company name -> id cache used by IngestService (app/services/company_resolver.py)
+    COMPANY_CACHE_SIZE: int = 50_000
+    COMPANY_CACHE_WARM_ON_START: bool = True # Preload it when a worker process starts
+
+    # Adaptive ingestion scheduling (app/worker/scheduler.py)
+    INGEST_SCHEDULER_ENABLED: bool = True
+    INGEST_SCHEDULER_TICK_SECONDS: int = 60 # How often due sources are claimed and enqueued
+    INGEST_SCHEDULER_BATCH_SIZE: int = 50 # Max sources claimed per tick
+    INGEST_SCHEDULER_SOURCES_PER_TASK: int = 4 # Claimed sources are split into Celery tasks of this size, to fit task_soft_time_limit
+    INGEST_SCHEDULER_LEASE_MINUTES: int = 30 # Re-enqueue a claimed source if its run never reports back
+    INGEST_MIN_INTERVAL_MINUTES: int = 15
+    INGEST_MAX_INTERVAL_MINUTES: int = 24 * 60
+    INGEST_INTERVAL_FACTOR: float = 2.0 # Multiplier for each back-off / tighten step
+    INGEST_ZERO_YIELD_RUNS: int = 3 # Consecutive runs without new jobs before backing off
+    INGEST_HIGH_CHURN_JOBS: int = 50 # New jobs in each of the last two runs that tighten the interval
+    INGEST_YIELD_WINDOW: int = 5 # Recent runs considered
+
+    # Near-duplicate detection (MinHash + LSH)
+    NEAR_DUP_ENABLED: bool = False # Off until its precision is checked on real feeds
+    NEAR_DUP_THRESHOLD: float = 0.8 # Estimated Jaccard similarity to treat as the same posting
+    NEAR_DUP_NUM_PERM: int = 128 # MinHash permutations
+
+    # Bloom filter in front of job_hash existence checks
+    SEEN_FILTER_BACKEND: str = "memory" # 'memory', 'redis' or 'off'
+    SEEN_FILTER_REDIS_URL: str = "redis://localhost:6379/1"
+    SEEN_FILTER_CAPACITY: int = 1_000_000 # Initial (memory) or total (redis) capacity
+    SEEN_FILTER_ERROR_RATE: float = 0.001
+
+    # Cold payload store for job descriptions and raw postings (app/services/payload_store.py)
+    PAYLOAD_STORE_ENABLED: bool = True
+    PAYLOAD_STORE_CODEC: str = "zstd" # 'zstd' (needs the 'zstandard' package, else zlib) or 'zlib'
+    PAYLOAD_STORE_MIN_BYTES: int = 256 # Shorter descriptions stay inline on the job row
+
+    # Shared outbound HTTP client pools (app/core/http.py)
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100 # Per origin
+    HTTP_CLIENT_MAX_KEEPALIVE: int = 20 # Per origin
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_CLIENT_TIMEOUT: float = 30.0
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 10.0
+    HTTP_CLIENT_HTTP2: bool = False # Requires the 'h2' package
+
+    # Detail-page enrichment of jobs without descriptions (app/services/job_ingest/enrich.py)
+    ENRICH_ENABLED: bool = True
+    ENRICH_TICK_SECONDS: int = 120 # How often the scheduler enqueues an enrichment run
+    ENRICH_CLAIM_SIZE: int = 200 # Jobs claimed per run
+    ENRICH_WRITE_BATCH: int = 50 # Job/cache rows written per commit
+    ENRICH_CONCURRENCY: int = 16 # Detail pages fetched at once
+    ENRICH_PER_DOMAIN_RPS: float = 1.0 # Requests per second per host, per worker process
+    ENRICH_LEASE_MINUTES: int = 15 # A claimed job is skipped by other runs for this long
+    ENRICH_REVALIDATE_HOURS: int = 24 # Before a fetched page is looked at again
+    ENRICH_RETRY_MINUTES: int = 30 # First retry after a failed fetch, doubling per failure
+    ENRICH_MAX_BYTES: int = 2_000_000 # Larger detail pages are not parsed
+
+    # Shared Playwright browser pool (app/services/scraper/browser.py)
+    BROWSER_POOL_SIZE: int = 4 # Max pages checked out at once per process
+    BROWSER_POOL_PREWARM: int = 2 # Contexts opened at startup
+    BROWSER_POOL_MAX_USES: int = 50 # Checkouts before a context is closed and replaced
+
+    # Paginated scraper sources (app/services/job_ingest/scraper.py)
+    SCRAPER_MAX_PAGES: int = 50 # Hard page budget per source run
+
+    # Request blocking for scraper pages (app/services/scraper/fetch_profile.py)
+    SCRAPER_BLOCK_REQUESTS: bool = True
+    SCRAPER_BLOCKED_RESOURCE_TYPES: List[str] = ["image", "media", "font"]
+    SCRAPER_BLOCKED_URL_PATTERNS: List[str] = [ # fnmatch globs against the full URL
+        "*google-analytics.com/*", "*googletagmanager.com/*", "*doubleclick.net/*",
+        "*connect.facebook.net/*", "*hotjar.com/*", "*segment.io/*", "*segment.com/*",
+        "*cdn.heapanalytics.com/*", "*bat.bing.com/*", "*snap.licdn.com/*", "*px.ads.linkedin.com/*",
+    ]
+
     # CORS
     BACKEND_CORS_ORIGINS: List[AnyHttpUrl] = []
 
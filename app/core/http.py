@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+def _pool_usage(client: httpx.AsyncClient) -> Optional[Tuple[int, int]]:
+    """
+    (connections, idle connections) of the client's httpcore pool. httpx
+    keeps the pool on its transport, which is not public API, so any change
+    there yields None instead of breaking callers.
+    """
+    try:
+        connections = list(client._transport._pool.connections)
+        return len(connections), sum(1 for conn in connections if conn.is_idle())
+    except Exception:
+        return None
+
+class HTTPClientRegistry:
+    """
+    App-wide registry of pooled `httpx.AsyncClient`s, one per origin
+    (scheme + host + port), so keep-alive connections and TLS sessions are
+    reused across ingest pages and LLM calls.
+
+    httpx clients are bound to the event loop they were first used on.
+    Celery tasks may run each job on a fresh loop, so clients created on a
+    previous loop are closed and replaced when a new loop shows up.
+    """
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._requests: Counter = Counter()
+        self._closing: Set[asyncio.Task] = set() # Strong refs until the close finishes
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """Return the pooled client for the origin of `url`. Must be called inside a running loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._clients:
+                logger.info("Event loop changed; closing pooled HTTP clients from the previous loop")
+                for client in self._clients.values():
+                    task = loop.create_task(self._close_stale(client))
+                    self._closing.add(task)
+                    task.add_done_callback(self._closing.discard)
+            self._clients = {}
+            self._loop = loop
+
+        origin = _origin(url)
+        client = self._clients.get(origin)
+        if client is None or client.is_closed:
+            client = self._create(origin)
+            self._clients[origin] = client
+        return client
+
+    def _create(self, origin: str) -> httpx.AsyncClient:
+        http2 = settings.HTTP_CLIENT_HTTP2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("HTTP_CLIENT_HTTP2 is set but the 'h2' package is missing; using HTTP/1.1")
+                http2 = False
+
+        async def _count_request(request: httpx.Request):
+            self._requests[origin] += 1
+
+        return httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE,
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(settings.HTTP_CLIENT_TIMEOUT, connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT),
+            event_hooks={"request": [_count_request]},
+        )
+
+    async def _close_stale(self, client: httpx.AsyncClient):
+        """Close a client left behind on a previous event loop."""
+        try:
+            await client.aclose()
+        except Exception as e:
+            # Its loop is already closed; the sockets are released once the client is collected
+            logger.debug(f"Could not close HTTP client from a previous event loop: {e}")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per-origin request counts and, when httpx exposes them, connection
+        pool usage.
+        """
+        stats = {}
+        for origin, client in self._clients.items():
+            stats[origin] = {"requests": self._requests[origin], "closed": int(client.is_closed)}
+            usage = _pool_usage(client)
+            if usage is not None:
+                connections, idle = usage
+                stats[origin].update(connections=connections, idle=idle, active=connections - idle)
+        return stats
+
+    async def aclose(self):
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP client: {e}")
+
+    def close(self):
+        """Synchronous close for shutdown hooks that run outside the event loop."""
+        loop = self._loop
+        if not self._clients or loop is None or loop.is_closed() or loop.is_running():
+            self._clients = {}
+            return
+        loop.run_until_complete(self.aclose())
+
+http_clients = HTTPClientRegistry()
@@ -0,0 +1,13 @@
+from typing import Type
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+def insert_for(session: AsyncSession, model: Type):
+    """Dialect-specific INSERT supporting ON CONFLICT ... DO NOTHING."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise ValueError(f"Bulk upsert not supported for dialect: {dialect}")
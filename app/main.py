@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.http import http_clients
 from app.db.session import init_db
 
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -12,19 +13,20 @@ from slowapi.errors import RateLimitExceeded
 
 limiter = Limiter(key_func=get_remote_address)
 
-from app.services.scraper.browser import browser_manager
+from app.services.scraper.browser import browser_pool
 from app.worker.scheduler import start_scheduler, stop_scheduler
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Create tables & start browser & scheduler
+    # Startup: Create tables & prewarm browser pool & start scheduler
     await init_db()
-    await browser_manager.start()
+    await browser_pool.start()
     start_scheduler()
     yield
     # Shutdown logic
     await stop_scheduler()
-    await browser_manager.stop()
+    await browser_pool.stop()
+    await http_clients.aclose()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
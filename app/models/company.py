@@ -1,6 +1,7 @@
 from typing import Optional
 from datetime import datetime
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 
 class CompanyBase(SQLModel):
     name: str = Field(index=True, unique=True)
@@ -9,8 +10,18 @@ class CompanyBase(SQLModel):
     logo_url: Optional[str] = None
 
 class Company(CompanyBase, table=True):
+    # Case-insensitive name lookups (app/services/company_resolver.py)
+    __table_args__ = (
+        Index("ix_company_name_lower", text("lower(name)")),
+        # One company per normalized name; the resolver's upsert conflicts on it
+        Index("uq_company_name_key", "name_key", unique=True),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    # company_key(name): casefolded, whitespace collapsed. NULL on rows from
+    # before it existed and on later spellings of an older company's name
+    name_key: Optional[str] = None
     
     # We will soft-link jobs by matching string for now to avoid breaking existing Job schema significantly, 
     # but ideally this would be a relationship.
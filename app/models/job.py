@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict
 from datetime import datetime
-from sqlmodel import SQLModel, Field, Relationship, Column, JSON
+from sqlmodel import SQLModel, Field, Relationship, Column, JSON, LargeBinary, BigInteger
+from sqlalchemy import UniqueConstraint
 
 # --- Enums & Shared ---
 
@@ -18,18 +19,38 @@ class JobSource(JobSourceBase, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     last_run: Optional[datetime] = None
     
+    # Conditional fetch validators from the last successful run
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_digest: Optional[str] = None # sha256 of the last fetched body
+    
+    # Adaptive scheduling: interval_minutes is the operator-set baseline,
+    # current_interval_minutes what the scheduler derived from recent yields
+    current_interval_minutes: Optional[int] = None
+    next_run_at: Optional[datetime] = Field(default=None, index=True)
+    
     jobs: List["Job"] = Relationship(back_populates="job_source")
     logs: List["IngestionLog"] = Relationship(back_populates="job_source")
 
 # --- Ingestion Log Model ---
 class IngestionLogBase(SQLModel):
     source_id: Optional[int] = Field(default=None, foreign_key="jobsource.id")
-    status: str # 'success', 'failed', 'partial'
+    status: str # 'success', 'failed', 'partial', 'unchanged'
     jobs_found: int = 0
     jobs_ingested: int = 0
     jobs_deduplicated: int = 0
     error_message: Optional[str] = None
     duration_seconds: float = 0.0
+    
+    # Per-stage wall time and I/O counters
+    fetch_seconds: float = 0.0
+    normalize_seconds: float = 0.0
+    dedup_seconds: float = 0.0
+    persist_seconds: float = 0.0
+    commit_seconds: float = 0.0
+    bytes_fetched: int = 0
+    pages_fetched: int = 0
+    db_round_trips: int = 0
 
 class IngestionLog(IngestionLogBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -37,6 +58,28 @@ class IngestionLog(IngestionLogBase, table=True):
     
     job_source: Optional[JobSource] = Relationship(back_populates="logs")
 
+# --- Ingestion Checkpoint Model ---
+class IngestCheckpoint(SQLModel, table=True):
+    """Progress of a chunk-committed run, so a retry of the same task resumes after the last commit."""
+    __table_args__ = (UniqueConstraint("source_id", "run_key"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    source_id: int = Field(foreign_key="jobsource.id", index=True)
+    run_key: str # e.g. the Celery task id, which stays the same across retries
+    position: Optional[Dict] = Field(default=None, sa_column=Column(JSON)) # {"consumed": n, "source": strategy checkpoint}
+    jobs_found: int = 0
+    jobs_ingested: int = 0
+    jobs_deduplicated: int = 0
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+# --- Source Fingerprint Model ---
+class SourceFingerprintSet(SQLModel, table=True):
+    """Compact set of raw-posting fingerprints seen on a source's last run."""
+    source_id: int = Field(foreign_key="jobsource.id", primary_key=True)
+    fingerprints: bytes = Field(default=b"", sa_column=Column(LargeBinary)) # packed uint64 array
+    count: int = 0
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
 # --- Job Model ---
 class JobBase(SQLModel):
     title: str
@@ -66,5 +109,60 @@ class Job(JobBase, table=True):
     source_id: Optional[int] = Field(default=None, foreign_key="jobsource.id")
     job_source: Optional[JobSource] = Relationship(back_populates="jobs")
     
+    # Cold payloads: when set, description / raw_data live in PayloadBlob
+    # and are NULL here (see app/services/payload_store.py)
+    description_digest: Optional[str] = None
+    raw_data_digest: Optional[str] = None
+    
     # Relationship to existing Application model (if any, forward ref string)
     applications: List["Application"] = Relationship(back_populates="job")
+
+# --- Cold Payload Store ---
+class PayloadBlob(SQLModel, table=True):
+    """Compressed job description or raw posting, shared by every job with identical content."""
+    digest: str = Field(primary_key=True) # sha256 of the uncompressed payload
+    codec: str # 'zstd', 'zlib' or 'raw'
+    data: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    size: int # Uncompressed bytes
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+# --- Detail Page Cache ---
+class DetailPageCache(SQLModel, table=True):
+    """
+    Last fetch of a job detail page by the enrichment crawler: validators for
+    revalidation, the fields extracted from it and when to look again.
+    """
+    url: str = Field(primary_key=True)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_digest: Optional[str] = None # sha256 of the fetched body
+    status_code: Optional[int] = None
+    # Extracted description; like Job, long ones live in PayloadBlob
+    description: Optional[str] = None
+    description_digest: Optional[str] = None
+    location: Optional[str] = None
+    failures: int = 0 # Consecutive failed fetches
+    fetched_at: Optional[datetime] = None
+    next_check_at: datetime = Field(default_factory=datetime.utcnow, index=True) # Also the claim lease
+
+# --- Near-Duplicate Index Models ---
+class JobSignature(SQLModel, table=True):
+    """MinHash signature of a stored job, used to verify LSH candidates."""
+    job_id: int = Field(foreign_key="job.id", primary_key=True)
+    minhash: bytes = Field(sa_column=Column(LargeBinary, nullable=False)) # packed uint64 array
+
+class JobLSHBucket(SQLModel, table=True):
+    """One row per (LSH band key, job); candidates share at least one band key."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    bucket: int = Field(sa_column=Column(BigInteger, index=True, nullable=False))
+    job_id: int = Field(foreign_key="job.id", index=True)
+
+class JobDuplicate(SQLModel, table=True):
+    """A posting recognised as a near-duplicate and linked to its canonical job instead of stored."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    job_hash: str = Field(unique=True, index=True)
+    canonical_job_id: int = Field(foreign_key="job.id", index=True)
+    source_id: Optional[int] = Field(default=None, foreign_key="jobsource.id")
+    url: Optional[str] = None
+    similarity: float
+    created_at: datetime = Field(default_factory=datetime.utcnow)
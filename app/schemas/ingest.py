@@ -3,7 +3,7 @@ from pydantic import BaseModel
 
 class IngestTriggerRequest(BaseModel):
     source_name: str
-    source_type: str # 'api', 'scraper'
+    source_type: str # 'api', 'scraper', 'rss'
     base_url: str
     config: Dict[str, Any]
     force_rescan: bool = False
@@ -1,7 +1,7 @@
 import abc
 from typing import Dict, Any, Optional
-import httpx
 import logging
+from app.core.http import http_clients
 
 logger = logging.getLogger(__name__)
 
@@ -44,15 +44,15 @@ class OpenAILikeProvider(LLMProvider):
         if json_mode:
             payload["response_format"] = {"type": "json_object"}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(f"{self.base_url}/chat/completions", json=payload, headers=headers, timeout=30.0)
-                response.raise_for_status()
-                data = response.json()
-                return data['choices'][0]['message']['content']
-            except Exception as e:
-                logger.error(f"LLM Request failed: {e}")
-                raise e
+        client = http_clients.get(self.base_url)
+        try:
+            response = await client.post(f"{self.base_url}/chat/completions", json=payload, headers=headers, timeout=30.0)
+            response.raise_for_status()
+            data = response.json()
+            return data['choices'][0]['message']['content']
+        except Exception as e:
+            logger.error(f"LLM Request failed: {e}")
+            raise e
 
     async def generate_text(self, system_prompt: str, user_prompt: str, max_tokens: int = 1000) -> str:
         messages = [
@@ -7,6 +7,7 @@ from typing import List, Dict
 from app.models.analytics import ApplicationOutcome, DailyMetric, OptimizationSuggestion
 from app.models.application import Application
 from app.models.job import Job
+from app.services.payload_store import payload_store
 
 class AnalyticsEngine:
     async def ingest_outcomes(self, db: AsyncSession, user_id: int):
@@ -46,8 +47,10 @@ class AnalyticsEngine:
         """
         stmt = select(ApplicationOutcome, Job).join(Job).where(ApplicationOutcome.user_id == user_id)
         result = await db.execute(stmt)
+        rows = result.all()
+        await payload_store.hydrate(db, [job for _, job in rows], ("description",))
         data = []
-        for outcome, job in result.all():
+        for outcome, job in rows:
             data.append({
                 "status": outcome.outcome_status,
                 "title": job.title,
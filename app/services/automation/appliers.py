@@ -4,7 +4,7 @@ import asyncio
 from typing import Dict
 from playwright.async_api import Page
 
-from app.services.scraper.browser import browser_manager
+from app.services.scraper.browser import browser_pool
 from app.services.automation.humanizer import Humanizer
 from app.models.user import User
 
@@ -63,7 +63,8 @@ class BaseApplier(abc.ABC):
 
 class GreenhouseApplier(BaseApplier):
     async def apply(self, url: str) -> bool:
-        page, context = await browser_manager.get_page()
+        pooled = await browser_pool.checkout()
+        page = pooled.page
         try:
             logger.info(f"Applying to Greenhouse: {url}")
             await page.goto(url, wait_until="networkidle")
@@ -96,11 +97,12 @@ class GreenhouseApplier(BaseApplier):
             logger.error(f"Greenhouse application failed: {e}")
             return False
         finally:
-            await context.close()
+            await browser_pool.checkin(pooled, discard=True)
 
 class LeverApplier(BaseApplier):
     async def apply(self, url: str) -> bool:
-        page, context = await browser_manager.get_page()
+        pooled = await browser_pool.checkout()
+        page = pooled.page
         try:
             await page.goto(url, wait_until="networkidle")
             await Humanizer.random_delay()
@@ -124,4 +126,4 @@ class LeverApplier(BaseApplier):
             logger.error(f"Lever failed: {e}")
             return False
         finally:
-            await context.close()
+            await browser_pool.checkin(pooled, discard=True)
@@ -5,7 +5,7 @@ from playwright.async_api import Page
 from app.models.application import Application, ApplicationStatus
 from app.models.job import Job
 from app.models.resume import Resume
-from .browser import BrowserManager
+from app.services.scraper.browser import browser_pool
 from .forms import FormDetector
 from .autofill import ResumeAutofill
 from .submitter import FormSubmitter
@@ -15,8 +15,7 @@ class AutoApplyEngine:
     def __init__(self, session: AsyncSession, application_id: int):
         self.session = session
         self.app_id = application_id
-        self.browser_manager = None
-        self.context = None
+        self.pooled = None
         self.page = None
         self.tracker = AutomationTracker(session, application_id)
 
@@ -42,10 +41,9 @@ class AutoApplyEngine:
             # Flatten or adapt data if needed
             resume_data['email'] = "user@example.com" # Placeholder if not in parsed
             
-            # 3. Launch Browser
-            self.browser_manager = await BrowserManager.get_instance()
-            self.context = await self.browser_manager.create_context()
-            self.page = await self.context.new_page()
+            # 3. Check out a page from the shared browser pool
+            self.pooled = await browser_pool.checkout()
+            self.page = self.pooled.page
 
             # 4. Navigate
             await self.page.goto(job.url)
@@ -86,6 +84,7 @@ class AutoApplyEngine:
                     pass
             raise e
         finally:
-            if self.context:
-                await self.context.close()
-            # Browser manager instance is shared, usually don't close browser here
+            if self.pooled:
+                # The context holds the applicant's session, storage and
+                # uploads; it's closed rather than handed to the next use
+                await browser_pool.checkin(self.pooled, discard=True)
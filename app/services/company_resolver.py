@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func, or_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.upsert import insert_for
+from app.models.company import Company
+
+def company_key(name: str) -> str:
+    """Case- and whitespace-insensitive lookup key for a company name."""
+    return " ".join(name.split()).casefold()
+
+class CompanyResolver:
+    """
+    Resolves company names to Company ids in bulk, creating missing ones.
+
+    A process-wide LRU of normalized name -> id answers repeat lookups
+    without touching the DB; misses cost one SELECT plus one multi-row
+    upsert for the whole batch. Only ids read back from committed rows are
+    cached, so a rolled-back batch can't leave ids of companies that don't
+    exist behind.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self.maxsize = maxsize or settings.COMPANY_CACHE_SIZE
+        self._ids: "OrderedDict[str, int]" = OrderedDict()
+
+    def _remember(self, key: str, company_id: int):
+        self._ids[key] = company_id
+        self._ids.move_to_end(key)
+        if len(self._ids) > self.maxsize:
+            self._ids.popitem(last=False)
+
+    async def warm(self, session: AsyncSession, limit: Optional[int] = None) -> int:
+        """Preload the most recently created companies. Returns the number cached."""
+        # Only rows holding their name_key: a NULL key marks a later spelling
+        # of an older company, which is the one lookups resolve to
+        result = await session.execute(
+            select(Company.id, Company.name_key)
+            .where(Company.name_key != None)
+            .order_by(Company.id.desc())
+            .limit(limit or self.maxsize)
+        )
+        rows = result.all()
+        # Oldest first, so the newest end up most recently used
+        for company_id, key in reversed(rows):
+            self._remember(key, company_id)
+        return len(rows)
+
+    async def resolve(self, session: AsyncSession, names: Iterable[str]) -> Dict[str, int]:
+        """
+        Map every non-empty name to a Company id (keyed by `company_key`),
+        inserting companies that don't exist yet. The caller commits.
+        """
+        names_by_key: Dict[str, str] = {}
+        for name in names:
+            if name and name.strip():
+                # The first spelling seen is the one a new company is created with
+                names_by_key.setdefault(company_key(name), " ".join(name.split()))
+        ids: Dict[str, int] = {}
+        for key in names_by_key:
+            if key in self._ids:
+                self._ids.move_to_end(key)
+                ids[key] = self._ids[key]
+
+        missing = [key for key in names_by_key if key not in ids]
+        if missing:
+            ids.update(await self._lookup(session, missing))
+            created = [key for key in missing if key not in ids]
+            if created:
+                stmt = (
+                    insert_for(session, Company)
+                    .values([
+                        {"name": names_by_key[key], "name_key": key, "created_at": datetime.utcnow()}
+                        for key in created
+                    ])
+                    .on_conflict_do_nothing(index_elements=["name_key"])
+                    .returning(Company.id, Company.name_key)
+                )
+                result = await session.execute(stmt)
+                inserted = {key: company_id for company_id, key in result.all()}
+                ids.update(inserted)
+                # Names created concurrently by another ingest
+                raced = [key for key in created if key not in inserted]
+                if raced:
+                    ids.update(await self._lookup(session, raced))
+        return ids
+
+    async def _lookup(self, session: AsyncSession, keys: Iterable[str]) -> Dict[str, int]:
+        keys = list(keys)
+        result = await session.execute(
+            select(Company.id, Company.name, Company.name_key)
+            .where(or_(
+                Company.name_key.in_(keys),
+                # Rows not backfilled yet (scripts/add_columns.py); catches plain case differences
+                (Company.name_key == None) & func.lower(Company.name).in_(keys),
+            ))
+            # The row holding the key wins, then the oldest of the unkeyed ones
+            .order_by(Company.name_key == None, Company.id)
+        )
+        found: Dict[str, int] = {}
+        for company_id, name, name_key in result.all():
+            found.setdefault(name_key or company_key(name), company_id)
+        for key, company_id in found.items():
+            self._remember(key, company_id)
+        return found
+
+company_resolver = CompanyResolver()
@@ -1,9 +1,11 @@
 from typing import List, Dict
 from sqlalchemy.future import select
 from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db.upsert import insert_for
 from app.models.job import Job
-from app.models.company import Company
 from app.models.crawl_log import CrawlLog
+from app.services.company_resolver import company_resolver
+from app.services.job_ingest.bloom import get_seen_filter
 
 class IngestService:
     def __init__(self, session: AsyncSession):
@@ -11,39 +13,57 @@ class IngestService:
 
     async def ingest_jobs(self, jobs_data: List[Dict], source_url: str):
         jobs_added = 0
-        company_cache = {}
 
+        # Only hashes the seen-filter can't rule out need a DB lookup
+        seen_filter = get_seen_filter()
+        maybe_present = {job_data.get("job_hash") for job_data in jobs_data}
+        if seen_filter:
+            await seen_filter.ensure_loaded(self.session)
+            maybe_present = set(await seen_filter.maybe_present(list(maybe_present)))
+
+        # 1. Resolve (and create) every company in the batch at once
+        await company_resolver.resolve(self.session, (job_data.get("company") for job_data in jobs_data))
+
+        # 2. Check Deduplication with one lookup for the whole batch
+        existing = set()
+        if maybe_present:
+            result = await self.session.execute(select(Job.job_hash).where(Job.job_hash.in_(maybe_present)))
+            existing = set(result.scalars().all())
+        confirmed = len(existing)
+
+        rows = []
         for job_data in jobs_data:
-            # 1. Handle Company
-            company_name = job_data.get("company")
-            if company_name not in company_cache:
-                result = await self.session.execute(select(Company).where(Company.name == company_name))
-                company = result.scalars().first()
-                if not company:
-                    company = Company(name=company_name)
-                    self.session.add(company)
-                    await self.session.commit()
-                    await self.session.refresh(company)
-                company_cache[company_name] = company
-            
-            # 2. Check Deduplication
             job_hash = job_data.get("job_hash")
-            existing_job = await self.session.execute(select(Job).where(Job.job_hash == job_hash))
-            if existing_job.scalars().first():
+            if job_hash in existing:
                 continue
+            # Also skips repeats within this batch
+            existing.add(job_hash)
 
             # 3. Create Job
             new_job = Job(
                 title=job_data["title"],
-                company=company_name, # keeping legacy string field
+                company=job_data.get("company"), # keeping legacy string field
                 location=job_data.get("location"),
                 url=job_data["url"],
                 source=job_data.get("source"),
                 job_hash=job_hash,
                 description=f"Imported from {job_data.get('source')}" 
             )
-            self.session.add(new_job)
-            jobs_added += 1
+            rows.append({column.name: getattr(new_job, column.name) for column in Job.__table__.columns if column.name != "id"})
+
+        if rows:
+            # ON CONFLICT covers hashes the filter called new but that are
+            # stored already, or were inserted by a concurrent ingest
+            stmt = (
+                insert_for(self.session, Job)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["job_hash"])
+                .returning(Job.job_hash)
+            )
+            jobs_added = len((await self.session.execute(stmt)).all())
+
+        if seen_filter:
+            seen_filter.record_confirmed(len(maybe_present), confirmed)
         
         # 4. Log Crawl
         log = CrawlLog(
@@ -54,5 +74,8 @@ class IngestService:
         )
         self.session.add(log)
         await self.session.commit()
+
+        if seen_filter:
+            await seen_filter.add_many(job_data.get("job_hash") for job_data in jobs_data)
         
         return {"found": len(jobs_data), "ingested": jobs_added}
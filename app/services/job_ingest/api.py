@@ -1,27 +1,217 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Optional
 import httpx
+import ijson
+from app.core.http import http_clients
 from .base import JobSourceBase
+from .conditional import conditional_fetch, conditional_headers
+
+# Hard stop for misconfigured pagination (e.g. a cursor that never ends)
+DEFAULT_MAX_PAGES = 1000
+
+class _ResponseReader:
+    """Async file-like adapter so ijson can consume an httpx byte stream."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+class _SpooledReader:
+    """Async file-like adapter over a (spooled) temporary file."""
+
+    def __init__(self, fileobj):
+        self._file = fileobj
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
 
 class APIJobSource(JobSourceBase):
-    """Generic API scraper."""
+    """
+    Generic API scraper.
+
+    Pagination is configured with an optional `pagination` block in the
+    source config:
+
+        {"type": "cursor", "cursor_param": "cursor", "cursor_path": "next_cursor"}
+        {"type": "offset", "offset_param": "offset", "limit_param": "limit", "page_size": 100}
+        {"type": "page", "page_param": "page", "start": 1}
+        {"type": "link"}  # follow the rel="next" Link header
+
+    Every type also accepts `max_pages`. Paginated sources can be
+    checkpointed mid-run and resumed from the page they stopped on.
+
+    Unpaginated feeds are fetched conditionally: stored ETag/Last-Modified
+    validators are sent along, and a 304 or a body whose digest matches the
+    last run marks the source as unchanged without yielding anything.
+    Paginated sources send the validators with their first page only: a 304
+    there marks the whole source unchanged, which holds for feeds that list
+    newest postings first. Pages are streamed, so there is no body digest.
+    Feeds whose later pages change independently set `"conditional": false`
+    in the pagination block.
+    """
     
+    def __init__(self, config: Dict[str, Any], validators: Optional[Dict[str, Optional[str]]] = None):
+        super().__init__(config, validators)
+        # Current page request and its page_state, for checkpoint()
+        self._position: Optional[Dict[str, Any]] = None
+        self._resume_state: Optional[Dict[str, Any]] = None
+
     async def fetch_jobs(self) -> List[Dict[str, Any]]:
+        return [raw async for raw in self.iter_jobs()]
+
+    def checkpoint(self) -> Optional[Dict[str, Any]]:
+        if not self._position:
+            return None
+        position = self._position
+        return {
+            "url": position["url"],
+            "params": position["params"],
+            "pages": position["pages"],
+            # Postings of the current page already handed out
+            "skip": position["page_state"]["count"],
+        }
+
+    def resume(self, state: Dict[str, Any]):
+        if not self.config.get("pagination"):
+            raise NotImplementedError
+        self._resume_state = state
+
+    async def iter_jobs(self) -> AsyncIterator[Dict[str, Any]]:
+        if not self.config.get("pagination"):
+            async for raw in self._iter_conditional():
+                yield raw
+            return
+
         url = self.config.get("url")
         headers = self.config.get("headers", {})
-        params = self.config.get("params", {})
-        
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=headers, params=params)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            # Allow config to specify where the list is located (e.g., 'results' or 'jobs')
-            list_key = self.config.get("list_key")
-            if list_key and list_key in data:
-                return data[list_key]
-            elif isinstance(data, list):
-                return data
-            return []
+        params = dict(self.config.get("params", {}))
+        pagination = self.config["pagination"]
+        mode = pagination.get("type")
+        max_pages = pagination.get("max_pages", DEFAULT_MAX_PAGES)
+
+        if mode == "offset":
+            page_size = pagination.get("page_size", 100)
+            params[pagination.get("limit_param", "limit")] = page_size
+            params.setdefault(pagination.get("offset_param", "offset"), 0)
+        elif mode == "page":
+            params.setdefault(pagination.get("page_param", "page"), pagination.get("start", 1))
+
+        pages, skip = 0, 0
+        conditional = pagination.get("conditional", True)
+        if self._resume_state:
+            # Re-request the page a previous run stopped on and skip what it handed out
+            state, self._resume_state = self._resume_state, None
+            url, params, pages, skip = state["url"], dict(state["params"]), state["pages"], state["skip"]
+            conditional = False
+
+        client = http_clients.get(url)
+        while url and pages < max_pages:
+            pages += 1
+            page_state = {"cursor": None, "count": 0}
+            self._position = {"url": url, "params": dict(params), "pages": pages - 1, "page_state": page_state}
+            request_headers = {**headers, **conditional_headers(self.validators)} if conditional else headers
+
+            async with client.stream("GET", url, headers=request_headers, params=params) as resp:
+                if conditional:
+                    conditional = False
+                    if resp.status_code == 304:
+                        self.pages_fetched += 1
+                        self.unchanged = True
+                        return
+                    self.validators = {
+                        "etag": resp.headers.get("etag"),
+                        "last_modified": resp.headers.get("last-modified"),
+                        "content_digest": None,
+                    }
+                resp.raise_for_status()
+                async for raw in self._iter_page(_ResponseReader(resp), pagination, page_state):
+                    page_state["count"] += 1
+                    if skip:
+                        skip -= 1
+                        continue
+                    yield raw
+                next_link = resp.links.get("next", {}).get("url")
+                self.pages_fetched += 1
+                self.bytes_fetched += resp.num_bytes_downloaded
+
+            # Work out the next request from the pagination mode
+            if mode == "cursor":
+                cursor = page_state["cursor"]
+                cursor_param = pagination.get("cursor_param", "cursor")
+                if not cursor or cursor == params.get(cursor_param):
+                    break
+                params[cursor_param] = cursor
+            elif mode == "offset":
+                if page_state["count"] < page_size:
+                    break
+                offset_param = pagination.get("offset_param", "offset")
+                params[offset_param] = int(params[offset_param]) + page_state["count"]
+            elif mode == "page":
+                if page_state["count"] == 0:
+                    break
+                page_param = pagination.get("page_param", "page")
+                params[page_param] = int(params[page_param]) + 1
+            elif mode == "link":
+                # The next link already carries its own query string
+                url, params = next_link, {}
+            else:
+                break
+
+    async def _iter_conditional(self) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch a single-document feed conditionally (see `conditional_fetch`) and decode it."""
+        async with conditional_fetch(self) as body:
+            if body is None:
+                return
+            async for raw in self._iter_page(_SpooledReader(body), {}, {}):
+                yield raw
+
+    async def _iter_page(
+        self, reader, pagination: Dict[str, Any], page_state: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Decode one page incrementally, yielding each job object as soon as it
+        is complete instead of materializing the whole body.
+        Accepts either a top-level array or an object holding the list under
+        `list_key`. Captures the cursor at `cursor_path` (dotted) on the way.
+        """
+        list_key = self.config.get("list_key")
+        item_prefixes = {"item"}
+        if list_key:
+            item_prefixes.add(f"{list_key}.item")
+        cursor_path = pagination.get("cursor_path")
+
+        builder: Optional[ijson.ObjectBuilder] = None
+        depth = 0
+        async for prefix, event, value in ijson.parse_async(reader, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                    if depth == 0:
+                        item, builder = builder.value, None
+                        if isinstance(item, dict):
+                            yield item
+                continue
+
+            if prefix in item_prefixes and event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+            elif cursor_path and prefix == cursor_path and event in ("string", "number"):
+                page_state["cursor"] = value
 
     async def validate_config(self) -> bool:
         return "url" in self.config
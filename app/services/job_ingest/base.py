@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional
 
 class JobSourceBase(ABC):
     """Abstract base class for all job sources (Scrapers, APIs, FeedParsers)."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], validators: Optional[Dict[str, Optional[str]]] = None):
         self.config = config
+        # Conditional fetch state ('etag', 'last_modified', 'content_digest').
+        # Sources that support it read the previous values and overwrite them
+        # with the ones observed on this fetch.
+        self.validators: Dict[str, Optional[str]] = dict(validators or {})
+        # Set when the source reports its content has not changed since the
+        # validators were recorded; nothing is yielded in that case.
+        self.unchanged = False
+        # Transfer counters for IngestionLog
+        self.bytes_fetched = 0
+        self.pages_fetched = 0
+        # Set by the pipeline: True when every given job_hash is already
+        # stored. Paginated sources use it to stop once they reach old postings.
+        self.all_stored: Optional[Callable[[List[str]], Awaitable[bool]]] = None
 
     @abstractmethod
     async def fetch_jobs(self) -> List[Dict[str, Any]]:
@@ -15,6 +28,27 @@ class JobSourceBase(ABC):
         """
         pass
 
+    def checkpoint(self) -> Optional[Dict[str, Any]]:
+        """
+        JSON-serializable state to resume right after the last posting
+        yielded so far, or None when the source can only be re-read from the
+        start (the pipeline then skips the postings it already committed).
+        """
+        return None
+
+    def resume(self, state: Dict[str, Any]):
+        """Continue from a `checkpoint()` of an interrupted run on the next `iter_jobs`."""
+        raise NotImplementedError
+
+    async def iter_jobs(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield raw job dictionaries as they arrive.
+        Sources that can stream or paginate should override this; the
+        default simply walks the materialized `fetch_jobs` result.
+        """
+        for raw in await self.fetch_jobs():
+            yield raw
+
     @abstractmethod
     async def validate_config(self) -> bool:
         """Validate if the provided configuration is sufficient."""
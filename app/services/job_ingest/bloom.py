@@ -0,0 +1,306 @@
+import asyncio
+import hashlib
+import logging
+import math
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.models.job import Job, JobDuplicate
+
+logger = logging.getLogger(__name__)
+
+def _positions(key: str, num_hashes: int, num_bits: int) -> List[int]:
+    """Kirsch-Mitzenmacher double hashing: k positions from one 128-bit digest."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:], "big") | 1
+    return [(h1 + i * h2) % num_bits for i in range(num_hashes)]
+
+def _optimal_size(capacity: int, error_rate: float):
+    num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+    num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+    return num_bits, num_hashes
+
+def _fp_rate(count: int, num_bits: int, num_hashes: int) -> float:
+    return (1 - math.exp(-num_hashes * count / num_bits)) ** num_hashes
+
+class BloomFilter:
+    """Fixed-capacity Bloom filter over a bytearray."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.num_bits, self.num_hashes = _optimal_size(capacity, error_rate)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def add(self, key: str):
+        for pos in _positions(key, self.num_hashes, self.num_bits):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in _positions(key, self.num_hashes, self.num_bits))
+
+    def estimated_fp_rate(self) -> float:
+        return _fp_rate(self.count, self.num_bits, self.num_hashes)
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows by chaining filters (Almeida et al.): each new
+    slice doubles capacity and halves its error rate so the compounded
+    false-positive rate stays below the configured one.
+    """
+
+    GROWTH = 2
+    TIGHTENING = 0.5
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.initial_capacity = capacity
+        self.error_rate = error_rate
+        self.clear()
+
+    def clear(self):
+        self.filters = [BloomFilter(self.initial_capacity, self.error_rate * (1 - self.TIGHTENING))]
+
+    @property
+    def count(self) -> int:
+        return sum(f.count for f in self.filters)
+
+    def add(self, key: str):
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(
+                current.capacity * self.GROWTH,
+                self.error_rate * (1 - self.TIGHTENING) * self.TIGHTENING ** len(self.filters),
+            )
+            self.filters.append(current)
+        current.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in f for f in reversed(self.filters))
+
+    def estimated_fp_rate(self) -> float:
+        miss = 1.0
+        for f in self.filters:
+            miss *= 1 - f.estimated_fp_rate()
+        return 1 - miss
+
+class LocalBloomBackend:
+    """In-process scalable filter; private to each worker process."""
+
+    name = "memory"
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.filter = ScalableBloomFilter(capacity, error_rate)
+
+    async def is_ready(self) -> bool:
+        return False # Never shared, so always rebuilt once per process
+
+    async def mark_ready(self):
+        pass
+
+    async def try_lock(self, ttl: int) -> bool:
+        return True # Nobody else rebuilds this filter
+
+    async def unlock(self):
+        pass
+
+    async def clear(self):
+        self.filter.clear()
+
+    async def add_many(self, keys: Iterable[str]):
+        for key in keys:
+            self.filter.add(key)
+
+    async def contains_many(self, keys: List[str]) -> List[bool]:
+        return [key in self.filter for key in keys]
+
+    async def count(self) -> int:
+        return self.filter.count
+
+    async def estimated_fp_rate(self) -> float:
+        return self.filter.estimated_fp_rate()
+
+# Deletes the rebuild lock only if it still holds our token
+_UNLOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+class RedisBloomBackend:
+    """
+    Fixed-size filter stored as a Redis bitmap, shared by every worker.
+    Sized for SEEN_FILTER_CAPACITY; past that the false-positive rate
+    degrades gracefully and is reported by `estimated_fp_rate`.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, capacity: int, error_rate: float, prefix: str = "ghosthire:seen_jobs"):
+        self.url = url
+        self.num_bits, self.num_hashes = _optimal_size(capacity, error_rate)
+        self.bits_key = f"{prefix}:bits"
+        self.count_key = f"{prefix}:count"
+        self.ready_key = f"{prefix}:ready"
+        self.lock_key = f"{prefix}:rebuild_lock"
+        self._token = uuid.uuid4().hex
+        self._client = None
+        self._loop = None
+
+    def _redis(self):
+        # redis.asyncio connections are tied to the loop that created them
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            import redis.asyncio as aioredis
+            self._client = aioredis.from_url(self.url)
+            self._loop = loop
+        return self._client
+
+    async def is_ready(self) -> bool:
+        return bool(await self._redis().exists(self.ready_key))
+
+    async def mark_ready(self):
+        await self._redis().set(self.ready_key, 1)
+
+    async def try_lock(self, ttl: int) -> bool:
+        """Take the rebuild lock (SET NX); it expires after `ttl` seconds if never released."""
+        return bool(await self._redis().set(self.lock_key, self._token, nx=True, ex=ttl))
+
+    async def unlock(self):
+        await self._redis().eval(_UNLOCK_SCRIPT, 1, self.lock_key, self._token)
+
+    async def clear(self):
+        await self._redis().delete(self.bits_key, self.count_key, self.ready_key)
+
+    async def add_many(self, keys: Iterable[str]):
+        pipe = self._redis().pipeline(transaction=False)
+        added = 0
+        for key in keys:
+            for pos in _positions(key, self.num_hashes, self.num_bits):
+                pipe.setbit(self.bits_key, pos, 1)
+            added += 1
+        if added:
+            pipe.incrby(self.count_key, added)
+            await pipe.execute()
+
+    async def contains_many(self, keys: List[str]) -> List[bool]:
+        if not keys:
+            return []
+        pipe = self._redis().pipeline(transaction=False)
+        for key in keys:
+            for pos in _positions(key, self.num_hashes, self.num_bits):
+                pipe.getbit(self.bits_key, pos)
+        bits = await pipe.execute()
+        k = self.num_hashes
+        return [all(bits[i * k:(i + 1) * k]) for i in range(len(keys))]
+
+    async def count(self) -> int:
+        return int(await self._redis().get(self.count_key) or 0)
+
+    async def estimated_fp_rate(self) -> float:
+        return _fp_rate(await self.count(), self.num_bits, self.num_hashes)
+
+class SeenHashFilter:
+    """
+    Front for `job_hash` existence checks. "Definitely new" answers skip
+    the database; only "maybe present" hashes are looked up. Inserts still
+    rely on the unique constraint, so a stale filter costs a wasted insert
+    attempt, never a duplicate row.
+    """
+
+    REBUILD_BATCH = 10000
+    REBUILD_LOCK_SECONDS = 900
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.loaded = False
+        self._lock: Optional[asyncio.Lock] = None
+        # Observed accuracy: "maybe" answers and how many the DB did not confirm
+        self.maybe_answers = 0
+        self.false_positives = 0
+
+    async def ensure_loaded(self, session: AsyncSession):
+        if self.loaded:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self.loaded:
+                return
+            # A shared filter is rebuilt by one worker; the others keep
+            # checking every hash against the DB until it's ready
+            if await self.backend.is_ready() or await self.rebuild(session, force=False):
+                self.loaded = True
+
+    async def rebuild(self, session: AsyncSession, force: bool = True) -> bool:
+        """
+        Repopulate the filter from every stored and linked job_hash, under the
+        backend's rebuild lock. Without `force` a filter another worker made
+        ready in the meantime is kept. Returns False if the lock is taken.
+        """
+        if not await self.backend.try_lock(self.REBUILD_LOCK_SECONDS):
+            return False
+        try:
+            if force or not await self.backend.is_ready():
+                await self.backend.clear()
+                total = 0
+                for column in (Job.job_hash, JobDuplicate.job_hash):
+                    result = await session.stream(select(column).execution_options(yield_per=self.REBUILD_BATCH))
+                    async for batch in result.scalars().partitions(self.REBUILD_BATCH):
+                        await self.backend.add_many(batch)
+                        total += len(batch)
+                await self.backend.mark_ready()
+                logger.info(f"Seen-hash filter ({self.backend.name}) rebuilt with {total} hashes")
+            self.loaded = True
+        finally:
+            await self.backend.unlock()
+        return True
+
+    async def maybe_present(self, hashes: List[str]) -> List[str]:
+        """The subset of `hashes` that might already be stored."""
+        if not self.loaded:
+            return list(hashes)
+        answers = await self.backend.contains_many(hashes)
+        maybe = [h for h, present in zip(hashes, answers) if present]
+        self.maybe_answers += len(maybe)
+        return maybe
+
+    def record_confirmed(self, maybe_count: int, confirmed_count: int):
+        """Record how many "maybe present" answers the DB actually confirmed."""
+        self.false_positives += maybe_count - confirmed_count
+
+    async def add_many(self, hashes: Iterable[str]):
+        if self.loaded:
+            await self.backend.add_many(hashes)
+
+    async def stats(self) -> Dict:
+        return {
+            "backend": self.backend.name,
+            "loaded": self.loaded,
+            "count": await self.backend.count(),
+            "estimated_fp_rate": await self.backend.estimated_fp_rate(),
+            "maybe_answers": self.maybe_answers,
+            "false_positives": self.false_positives,
+            "observed_fp_rate": self.false_positives / self.maybe_answers if self.maybe_answers else 0.0,
+        }
+
+_seen_filter: Optional[SeenHashFilter] = None
+
+def get_seen_filter() -> Optional[SeenHashFilter]:
+    """Process-wide filter per SEEN_FILTER_BACKEND ('memory', 'redis' or 'off')."""
+    global _seen_filter
+    if _seen_filter is None and settings.SEEN_FILTER_BACKEND != "off":
+        if settings.SEEN_FILTER_BACKEND == "redis":
+            backend = RedisBloomBackend(
+                settings.SEEN_FILTER_REDIS_URL, settings.SEEN_FILTER_CAPACITY, settings.SEEN_FILTER_ERROR_RATE
+            )
+        else:
+            backend = LocalBloomBackend(settings.SEEN_FILTER_CAPACITY, settings.SEEN_FILTER_ERROR_RATE)
+        _seen_filter = SeenHashFilter(backend)
+    return _seen_filter
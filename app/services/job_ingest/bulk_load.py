@@ -0,0 +1,59 @@
+import json
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy import JSON, column, select, table, text
+from sqlalchemy.dialects import postgresql
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.job import Job
+
+STAGING_TABLE = "job_staging"
+
+# Every Job column except the serial id, in table order
+_COLUMNS = [c for c in Job.__table__.columns if c.name != "id"]
+_COLUMN_NAMES = [c.name for c in _COLUMNS]
+# COPY sends json columns as text
+_JSON_COLUMNS = {c.name for c in _COLUMNS if isinstance(c.type, JSON)}
+
+def supports_copy(session: AsyncSession) -> bool:
+    bind = session.get_bind()
+    return bind.dialect.name == "postgresql" and bind.dialect.driver == "asyncpg"
+
+def _record(row: Dict[str, Any]) -> Tuple:
+    return tuple(
+        json.dumps(row.get(name)) if name in _JSON_COLUMNS and row.get(name) is not None else row.get(name)
+        for name in _COLUMN_NAMES
+    )
+
+async def copy_merge_jobs(session: AsyncSession, rows: Sequence[Dict[str, Any]]) -> List[Tuple[int, str]]:
+    """
+    Load Job column mappings with COPY into a per-connection temp staging
+    table, then merge them into `job` with one INSERT ... SELECT ... ON
+    CONFLICT (job_hash) DO NOTHING. Returns (id, job_hash) of the rows the
+    merge actually inserted, like the plain INSERT ... RETURNING path.
+    Runs inside the session's transaction. Postgres + asyncpg only.
+    """
+    # Same columns as job minus id, without constraints or defaults. Survives
+    # on the pooled connection and is emptied before each load. Issued through
+    # the session so the transaction is open before COPY goes to the driver
+    await session.execute(text(
+        f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} ON COMMIT DELETE ROWS AS "
+        f"SELECT {', '.join(_COLUMN_NAMES)} FROM job WITH NO DATA"
+    ))
+    await session.execute(text(f"TRUNCATE {STAGING_TABLE}"))
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        STAGING_TABLE, records=[_record(row) for row in rows], columns=_COLUMN_NAMES
+    )
+
+    staging = table(STAGING_TABLE, *(column(name) for name in _COLUMN_NAMES))
+    merge = (
+        postgresql.insert(Job)
+        .from_select(_COLUMN_NAMES, select(*staging.c))
+        .on_conflict_do_nothing(index_elements=["job_hash"])
+        .returning(Job.id, Job.job_hash)
+    )
+    result = await session.execute(merge)
+    return result.all()
@@ -0,0 +1,66 @@
+import hashlib
+import tempfile
+from contextlib import asynccontextmanager
+from typing import IO, AsyncIterator, Dict, Optional
+
+from app.core.http import http_clients
+from .base import JobSourceBase
+
+# Conditional bodies larger than this are spooled to disk while hashing
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+def conditional_headers(validators: Dict[str, Optional[str]]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from stored validators."""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+@asynccontextmanager
+async def conditional_fetch(source: JobSourceBase) -> AsyncIterator[Optional[IO[bytes]]]:
+    """
+    GET a single-document source (`url`, `headers`, `params` from its config)
+    with its stored validators. The body is hashed while it is spooled, so an
+    identical payload is detected before any of it is decoded, and the
+    connection is handed back before the caller parses.
+
+    Yields the spooled body rewound to the start, or None when the server
+    answered 304 or the digest matches the last run (`source.unchanged` is
+    set then). Updates the source's validators and transfer counters.
+    """
+    url = source.config.get("url")
+    headers = {**source.config.get("headers", {}), **conditional_headers(source.validators)}
+    params = source.config.get("params", {})
+
+    client = http_clients.get(url)
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spool:
+        async with client.stream("GET", url, headers=headers, params=params) as resp:
+            source.pages_fetched += 1
+            if resp.status_code == 304:
+                source.unchanged = True
+                yield None
+                return
+            resp.raise_for_status()
+
+            digest = hashlib.sha256()
+            async for chunk in resp.aiter_bytes():
+                digest.update(chunk)
+                spool.write(chunk)
+            source.bytes_fetched += resp.num_bytes_downloaded
+
+            previous_digest = source.validators.get("content_digest")
+            source.validators = {
+                "etag": resp.headers.get("etag"),
+                "last_modified": resp.headers.get("last-modified"),
+                "content_digest": digest.hexdigest(),
+            }
+
+        if previous_digest == source.validators["content_digest"]:
+            source.unchanged = True
+            yield None
+            return
+
+        spool.seek(0)
+        yield spool
@@ -1,9 +1,62 @@
 import hashlib
-from typing import Dict, Any
+import re
+import zlib
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+# Common title/description abbreviations folded before shingling
+_ABBREVIATIONS = {
+    "sr": "senior",
+    "snr": "senior",
+    "jr": "junior",
+    "jnr": "junior",
+    "mgr": "manager",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "swe": "software engineer",
+    "sde": "software engineer",
+    "ml": "machine learning",
+    "assoc": "associate",
+}
+_NON_WORD = re.compile(r"[^a-z0-9+#]+")
+# Title words that make otherwise identical postings different openings
+_SENIORITY = {
+    "intern", "junior", "associate", "mid", "senior", "staff", "principal",
+    "lead", "manager", "director", "head", "vp", "i", "ii", "iii", "iv",
+}
+
+# Universal hashing (a * x + b) mod p over 32-bit shingle hashes
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+def lsh_params(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) with bands * rows <= num_perm whose S-curve
+    threshold (1 / bands) ** (1 / rows) is closest to `threshold`.
+    """
+    best = (1, num_perm)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
 
 class JobDeduplicator:
     """Handles logic for detecting unique jobs."""
 
+    def __init__(self, num_perm: int = 128, threshold: float = 0.8, seed: int = 1):
+        # Near-duplicate detection: MinHash signatures banded for LSH
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.bands, self.rows = lsh_params(num_perm, threshold)
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, (1 << 61) - 1, size=num_perm, dtype=np.uint64)
+
     def generate_hash(self, valid_job_data: Dict[str, Any]) -> str:
         """
         Create a deterministic hash based on core identity fields.
@@ -18,3 +71,61 @@ class JobDeduplicator:
         
         raw_string = f"{title}|{company}|{location}"
         return hashlib.sha256(raw_string.encode('utf-8')).hexdigest()
+
+    def shingles(self, valid_job_data: Dict[str, Any], k: int = 3) -> List[str]:
+        """
+        Word k-grams over normalized company + title + description.
+        The company is included so identical titles at different companies
+        don't collapse into one posting.
+        """
+        text = " ".join(
+            valid_job_data.get(field) or "" for field in ("company", "title", "description")
+        ).lower()
+        words = [_ABBREVIATIONS.get(w, w) for w in _NON_WORD.split(text) if w]
+        if len(words) <= k:
+            return [" ".join(words)]
+        return list({" ".join(words[i:i + k]) for i in range(len(words) - k + 1)})
+
+    def identity(self, valid_job_data: Dict[str, Any]) -> Tuple[str, Tuple[str, ...]]:
+        """
+        (normalized location, seniority words of the title). Postings only
+        count as near-duplicates when both match: the same description is
+        routinely reused for openings in other offices or at other levels.
+        """
+        location = " ".join(w for w in _NON_WORD.split((valid_job_data.get("location") or "").lower()) if w)
+        title = (valid_job_data.get("title") or "").lower()
+        seniority = {_ABBREVIATIONS.get(w, w) for w in _NON_WORD.split(title) if w}
+        return location, tuple(sorted(seniority & _SENIORITY))
+
+    def minhash(self, valid_job_data: Dict[str, Any]) -> np.ndarray:
+        """MinHash signature (num_perm uint64 values) of the posting's shingles."""
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in self.shingles(valid_job_data)),
+            dtype=np.uint64,
+        )
+        # Overflow in a * x wraps mod 2**64, which is fine for hashing purposes
+        with np.errstate(over="ignore"):
+            permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME & _MAX_HASH
+        return permuted.min(axis=0)
+
+    def bucket_keys(self, signature: np.ndarray) -> List[int]:
+        """One signed 64-bit key per LSH band (fits a BIGINT column)."""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(chunk, digest_size=8, person=band.to_bytes(2, "big")).digest()
+            keys.append(int.from_bytes(digest, "big", signed=True))
+        return keys
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.count_nonzero(a == b)) / len(a)
+
+    @staticmethod
+    def pack(signature: np.ndarray) -> bytes:
+        return signature.astype("<u8").tobytes()
+
+    @staticmethod
+    def unpack(data: bytes) -> Optional[np.ndarray]:
+        return np.frombuffer(data, dtype="<u8").astype(np.uint64) if data else None
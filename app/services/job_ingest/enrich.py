@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from sqlalchemy import bindparam, or_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.http import http_clients
+from app.db.upsert import insert_for
+from app.models.job import DetailPageCache, Job
+from app.services.payload_store import payload_store
+from app.services.scraper.parsers import parse_job_detail
+from .conditional import conditional_headers
+
+logger = logging.getLogger(__name__)
+
+# IngestService stores this in place of a description
+PLACEHOLDER_PREFIX = "Imported from "
+UNKNOWN_LOCATIONS = ("", "Unknown")
+
+_CACHE_COLUMNS = [c.name for c in DetailPageCache.__table__.columns]
+
+def missing_description():
+    """Jobs whose description is empty, never fetched or IngestService's placeholder."""
+    return or_(
+        (Job.description == None) & (Job.description_digest == None),
+        Job.description == "",
+        Job.description.startswith(PLACEHOLDER_PREFIX),
+    )
+
+class DomainRateLimiter:
+    """
+    Spaces requests to the same host at least 1/rate seconds apart.
+    Per-host locks belong to the event loop they were first used on and are
+    replaced on a new loop; the schedule itself carries over.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next: Dict[str, float] = defaultdict(float)
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def wait(self, host: str):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._locks = defaultdict(asyncio.Lock)
+            self._loop = loop
+        async with self._locks[host]:
+            now = time.monotonic()
+            delay = self._next[host] - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next[host] = max(now, self._next[host]) + self.interval
+
+_domain_limiters: Dict[float, DomainRateLimiter] = {}
+
+def get_domain_limiter(rate: float) -> DomainRateLimiter:
+    """Process-wide limiter for `rate`, so back-to-back and overlapping runs share each host's spacing."""
+    limiter = _domain_limiters.get(rate)
+    if limiter is None:
+        limiter = _domain_limiters[rate] = DomainRateLimiter(rate)
+    return limiter
+
+@dataclass
+class EnrichResult:
+    job_id: int
+    job_location: Optional[str]
+    cache: Dict[str, Any] # DetailPageCache column mapping to upsert
+    fetched: bool = False # False when the cached copy was still good (304 / same body)
+
+class JobEnricher:
+    """
+    Fills in descriptions (and unknown locations) of scraped jobs from their
+    detail pages.
+
+    Each run claims a batch of jobs that are missing a description and whose
+    URL isn't leased or cooling down in DetailPageCache, by upserting the
+    cache rows with a lease, so overlapping runs never fetch the same page.
+    Pages are fetched on the shared HTTP pool with bounded concurrency and
+    per-host spacing, revalidated with the cached ETag / Last-Modified, and
+    parsed in a worker thread. Jobs and cache rows are written in batches.
+    Failed fetches are retried with exponential backoff; pages that had
+    nothing to extract are looked at again after ENRICH_REVALIDATE_HOURS.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        concurrency: Optional[int] = None,
+        per_domain_rps: Optional[float] = None,
+    ):
+        self.session_factory = session_factory
+        self._slots = asyncio.Semaphore(concurrency or settings.ENRICH_CONCURRENCY)
+        self._limiter = get_domain_limiter(per_domain_rps or settings.ENRICH_PER_DOMAIN_RPS)
+
+    async def run_once(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """Claim, fetch and write back one batch. Returns counters for logging."""
+        counts = {"claimed": 0, "fetched": 0, "cached": 0, "enriched": 0, "failed": 0}
+        async with self.session_factory() as session:
+            claimed = await self._claim(session, limit or settings.ENRICH_CLAIM_SIZE)
+            await session.commit()
+            counts["claimed"] = len(claimed)
+            if not claimed:
+                return counts
+
+            batch: List[EnrichResult] = []
+            for task in asyncio.as_completed([self._enrich(job, cache) for job, cache in claimed]):
+                result = await task
+                if result.cache["failures"]:
+                    counts["failed"] += 1
+                else:
+                    counts["fetched" if result.fetched else "cached"] += 1
+                batch.append(result)
+                if len(batch) >= settings.ENRICH_WRITE_BATCH:
+                    counts["enriched"] += await self._write(session, batch)
+                    batch = []
+            if batch:
+                counts["enriched"] += await self._write(session, batch)
+        logger.info(f"Enrichment run: {counts}")
+        return counts
+
+    async def _claim(self, session: AsyncSession, limit: int) -> List[tuple]:
+        now = datetime.utcnow()
+        result = await session.execute(
+            select(Job.id, Job.url, Job.location)
+            .outerjoin(DetailPageCache, DetailPageCache.url == Job.url)
+            .where(missing_description())
+            .where(or_(DetailPageCache.url == None, DetailPageCache.next_check_at <= now))
+            .order_by(Job.id.desc())
+            .limit(limit)
+        )
+        jobs = {url: (job_id, url, location) for job_id, url, location in result.all()}
+        if not jobs:
+            return []
+
+        # Take the lease; a concurrent run that got there first makes the
+        # WHERE fail, so its URLs don't come back
+        lease = now + timedelta(minutes=settings.ENRICH_LEASE_MINUTES)
+        stmt = insert_for(session, DetailPageCache).values([{"url": url, "next_check_at": lease} for url in jobs])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["url"],
+            set_={"next_check_at": lease},
+            where=DetailPageCache.next_check_at <= now,
+        ).returning(*DetailPageCache.__table__.columns)
+        rows = (await session.execute(stmt)).mappings().all()
+        return [(jobs[row["url"]], dict(row)) for row in rows]
+
+    async def _enrich(self, job: tuple, cache: Dict[str, Any]) -> EnrichResult:
+        job_id, url, location = job
+        now = datetime.utcnow()
+        result = EnrichResult(job_id=job_id, job_location=location, cache=cache)
+        try:
+            # Wait out the host's spacing before taking a slot, so one busy
+            # host can't fill every slot with sleeping fetches
+            await self._limiter.wait(urlsplit(url).netloc.lower())
+            async with self._slots:
+                resp, body = await self._fetch(url, cache)
+            cache["status_code"] = resp.status_code
+            if resp.status_code == 304 and cache["fetched_at"]:
+                pass # Cached description/location still hold
+            else:
+                resp.raise_for_status()
+                result.fetched = True
+                digest = hashlib.sha256(body).hexdigest()
+                if digest != cache["content_digest"] or not cache["fetched_at"]:
+                    text = body.decode(resp.encoding or "utf-8", errors="replace")
+                    parsed = await asyncio.to_thread(parse_job_detail, text)
+                    cache.update(
+                        description=parsed["description"] or None,
+                        description_digest=None,
+                        location=parsed["location"] or None,
+                        content_digest=digest,
+                    )
+                cache.update(etag=resp.headers.get("etag"), last_modified=resp.headers.get("last-modified"))
+            cache.update(
+                failures=0,
+                fetched_at=now,
+                next_check_at=now + timedelta(hours=settings.ENRICH_REVALIDATE_HOURS),
+            )
+        except Exception as e:
+            failures = (cache["failures"] or 0) + 1
+            backoff = min(
+                timedelta(minutes=settings.ENRICH_RETRY_MINUTES * 2 ** (failures - 1)),
+                timedelta(hours=settings.ENRICH_REVALIDATE_HOURS),
+            )
+            cache.update(failures=failures, next_check_at=now + backoff)
+            logger.info(f"Detail page {url} failed ({failures}x), retrying in {backoff}: {e}")
+        return result
+
+    async def _fetch(self, url: str, cache: Dict[str, Any]) -> Tuple[httpx.Response, bytes]:
+        """GET `url`, revalidating against the cached validators; bodies over ENRICH_MAX_BYTES are abandoned."""
+        client = http_clients.get(url)
+        async with client.stream("GET", url, headers=conditional_headers(cache), follow_redirects=True) as resp:
+            body = bytearray()
+            if resp.status_code == 200:
+                async for chunk in resp.aiter_bytes():
+                    body += chunk
+                    if len(body) > settings.ENRICH_MAX_BYTES:
+                        raise ValueError(f"detail page is over {settings.ENRICH_MAX_BYTES} bytes")
+        return resp, bytes(body)
+
+    async def _write(self, session: AsyncSession, batch: List[EnrichResult]) -> int:
+        """Upsert the cache rows and update the jobs that got something. Returns jobs updated."""
+        caches = [result.cache for result in batch]
+        if settings.PAYLOAD_STORE_ENABLED:
+            # Long descriptions are stored once, shared by cache row and job
+            await payload_store.save(session, payload_store.offload(caches))
+        stmt = insert_for(session, DetailPageCache).values(caches)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["url"],
+            set_={name: stmt.excluded[name] for name in _CACHE_COLUMNS if name != "url"},
+        )
+        await session.execute(stmt)
+
+        updates = []
+        for result in batch:
+            cache = result.cache
+            if not (cache["description"] or cache["description_digest"]):
+                continue
+            location = result.job_location
+            if (location or "") in UNKNOWN_LOCATIONS and cache["location"]:
+                location = cache["location"]
+            updates.append({
+                "_id": result.job_id,
+                "description": cache["description"],
+                "description_digest": cache["description_digest"],
+                "location": location,
+                "updated_at": datetime.utcnow(),
+            })
+        if updates:
+            table = Job.__table__
+            await session.execute(
+                update(table)
+                .where(table.c.id == bindparam("_id"))
+                .values(
+                    description=bindparam("description"),
+                    description_digest=bindparam("description_digest"),
+                    location=bindparam("location"),
+                    updated_at=bindparam("updated_at"),
+                ),
+                updates,
+            )
+        await session.commit()
+        return len(updates)
@@ -0,0 +1,40 @@
+import hashlib
+import json
+from array import array
+from typing import Any, Dict, Iterable, List, Set
+
+class PostingFingerprints:
+    """
+    Tracks which raw postings a source served last time.
+    Each posting is reduced to a 64-bit digest of its canonical JSON, so a
+    source with 100k postings costs ~800KB packed. Postings whose digest was
+    seen on the previous run are unchanged and can skip the pipeline.
+    """
+
+    def __init__(self, previous: Iterable[int] = ()):
+        self.previous: Set[int] = set(previous)
+        self.seen: Set[int] = set()
+
+    @staticmethod
+    def fingerprint(raw_job: Dict[str, Any]) -> int:
+        payload = json.dumps(raw_job, sort_keys=True, separators=(",", ":"), default=str)
+        return int.from_bytes(hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def filter_changed(self, raw_jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Record every posting as seen and return only new or changed ones."""
+        changed = []
+        for raw in raw_jobs:
+            fp = self.fingerprint(raw)
+            self.seen.add(fp)
+            if fp not in self.previous:
+                changed.append(raw)
+        return changed
+
+    @staticmethod
+    def load(data: bytes) -> Set[int]:
+        packed = array("Q")
+        packed.frombytes(data or b"")
+        return set(packed)
+
+    def dump(self) -> bytes:
+        return array("Q", sorted(self.seen)).tobytes()
@@ -0,0 +1,123 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple, Union
+
+from sqlmodel import select, insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.job import Job, JobSignature, JobLSHBucket, JobDuplicate
+from .deduplicator import JobDeduplicator
+
+# (duplicate job_hash, canonical job id or job_hash of a row inserted in the same chunk, similarity)
+Link = Tuple[str, Union[int, str], float]
+
+class NearDuplicateIndex:
+    """
+    LSH index of MinHash signatures persisted in the `joblshbucket` and
+    `jobsignature` tables, so every worker shares it. A lookup is one
+    indexed IN query on the incoming postings' band keys followed by
+    signature verification of the (few) candidates, so cost does not grow
+    with the size of the job table. Candidates must also share the
+    posting's location and seniority (see `JobDeduplicator.identity`).
+    """
+
+    def __init__(self, session: AsyncSession, deduplicator: JobDeduplicator):
+        self.session = session
+        self.deduplicator = deduplicator
+
+    async def split(
+        self, rows: Dict[str, Dict[str, Any]], signatures: Dict[str, bytes]
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[Link]]:
+        """
+        Separate rows to insert from near-duplicates of stored jobs or of
+        earlier rows in the same chunk. Returns (rows to insert, links).
+        """
+        dedup = self.deduplicator
+        unpacked = {job_hash: dedup.unpack(signatures[job_hash]) for job_hash in rows if job_hash in signatures}
+        keys = {job_hash: dedup.bucket_keys(sig) for job_hash, sig in unpacked.items()}
+        all_keys = {key for row_keys in keys.values() for key in row_keys}
+        if not all_keys:
+            return rows, []
+
+        # Candidate stored jobs sharing at least one band
+        stored = defaultdict(set)
+        result = await self.session.execute(
+            select(JobLSHBucket.bucket, JobLSHBucket.job_id).where(JobLSHBucket.bucket.in_(list(all_keys)))
+        )
+        for bucket, job_id in result.all():
+            stored[bucket].add(job_id)
+
+        candidate_ids = {job_id for ids in stored.values() for job_id in ids}
+        stored_signatures, stored_identities = {}, {}
+        if candidate_ids:
+            result = await self.session.execute(
+                select(JobSignature.job_id, JobSignature.minhash, Job.title, Job.location)
+                .join(Job, Job.id == JobSignature.job_id)
+                .where(JobSignature.job_id.in_(list(candidate_ids)))
+            )
+            for job_id, minhash, title, location in result.all():
+                stored_signatures[job_id] = dedup.unpack(minhash)
+                stored_identities[job_id] = dedup.identity({"title": title, "location": location})
+
+        accepted: Dict[str, Dict[str, Any]] = {}
+        links: List[Link] = []
+        pending = defaultdict(set) # band key -> hashes accepted earlier in this chunk
+        for job_hash, row in rows.items():
+            signature = unpacked.get(job_hash)
+            if signature is None:
+                accepted[job_hash] = row
+                continue
+
+            identity = dedup.identity(row)
+            best, best_similarity = None, 0.0
+            for key in keys[job_hash]:
+                for job_id in stored.get(key, ()):
+                    if job_id in stored_signatures and stored_identities[job_id] == identity:
+                        similarity = dedup.similarity(signature, stored_signatures[job_id])
+                        if similarity > best_similarity:
+                            best, best_similarity = job_id, similarity
+                for other_hash in pending.get(key, ()):
+                    if dedup.identity(accepted[other_hash]) != identity:
+                        continue
+                    similarity = dedup.similarity(signature, unpacked[other_hash])
+                    if similarity > best_similarity:
+                        best, best_similarity = other_hash, similarity
+
+            if best is not None and best_similarity >= dedup.threshold:
+                links.append((job_hash, best, best_similarity))
+                continue
+
+            accepted[job_hash] = row
+            for key in keys[job_hash]:
+                pending[key].add(job_hash)
+        return accepted, links
+
+    async def add(self, ids_by_hash: Dict[str, int], signatures: Dict[str, bytes]):
+        """Index newly inserted jobs."""
+        signature_rows, bucket_rows = [], []
+        for job_hash, job_id in ids_by_hash.items():
+            packed = signatures.get(job_hash)
+            if not packed:
+                continue
+            signature_rows.append({"job_id": job_id, "minhash": packed})
+            for key in self.deduplicator.bucket_keys(self.deduplicator.unpack(packed)):
+                bucket_rows.append({"bucket": key, "job_id": job_id})
+
+        if signature_rows:
+            await self.session.execute(insert(JobSignature).values(signature_rows))
+            await self.session.execute(insert(JobLSHBucket).values(bucket_rows))
+
+    async def link(self, links: List[Link], ids_by_hash: Dict[str, int], rows: Dict[str, Dict[str, Any]]):
+        """Record near-duplicates against their canonical job instead of storing them."""
+        for job_hash, canonical, similarity in links:
+            canonical_id = ids_by_hash.get(canonical) if isinstance(canonical, str) else canonical
+            if canonical_id is None:
+                # In-chunk canonical lost an insert race; the duplicate is still dropped
+                continue
+            row = rows[job_hash]
+            self.session.add(JobDuplicate(
+                job_hash=job_hash,
+                canonical_job_id=canonical_id,
+                source_id=row.get("source_id"),
+                url=row.get("url"),
+                similarity=similarity,
+            ))
@@ -1,5 +1,8 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache
+import json
 import re
+import string
 
 class JobNormalizer:
     """Normalizes raw job data into structured format."""
@@ -29,6 +32,10 @@ class JobNormalizer:
             "raw_data": raw_job
         }
 
+    def normalize_many(self, raw_jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Normalize a batch of raw jobs."""
+        return [self.normalize(raw) for raw in raw_jobs]
+
     def _extract_salary(self, text: str) -> tuple[Optional[float], Optional[float], Optional[str]]:
         """Simple regex-based salary extraction."""
         # This is a basic implementation. In production, use NLP or rigorous regex patterns.
@@ -62,3 +69,162 @@ class JobNormalizer:
         keywords = ["remote", "work from home", "wfh"]
         text = (location + " " + description).lower()
         return any(k in text for k in keywords)
+
+# --- Compiled normalizer ---
+
+# alias -> canonical tag. Canonical order is the order tags are reported in.
+DEFAULT_TAXONOMY: Dict[str, str] = {
+    "python": "python",
+    "java": "java",
+    "react": "react",
+    "react.js": "react",
+    "reactjs": "react",
+    "fastapi": "fastapi",
+    "docker": "docker",
+    "kubernetes": "kubernetes",
+    "k8s": "kubernetes",
+    "aws": "aws",
+    "amazon web services": "aws",
+    "sql": "sql",
+    "postgresql": "sql",
+    "mysql": "sql",
+}
+
+REMOTE_KEYWORDS = ["remote", "work from home", "wfh"]
+
+_SALARY_RE = re.compile(r'\$(\d{2,3})k', re.IGNORECASE)
+# A "word" for tagging: letters/digits plus +, # and inner dots (c++, c#, node.js)
+_TOKEN_RE = re.compile(r'[a-z0-9+#]+(?:\.[a-z0-9+#]+)*')
+# Punctuation that separates words; '+', '#' and '.' can be part of a tag
+_WORD_BREAKS = str.maketrans({ch: " " for ch in string.punctuation if ch not in "+#."})
+
+def _trie_pattern(words: List[str]) -> str:
+    """
+    Build a regex alternation shaped like a prefix trie, e.g.
+    ['java', 'javascript'] -> 'java(?:script)?'. The regex engine then walks
+    shared prefixes once per position instead of retrying every word.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if terminal else group
+
+    return build(trie)
+
+@lru_cache(maxsize=8)
+def load_taxonomy(path: Optional[str] = None) -> Tuple[Tuple[str, str], ...]:
+    """
+    Load (alias, canonical) tag pairs. The file is JSON, either a list of
+    tags or an {alias: canonical} mapping. Without a path the built-in
+    DEFAULT_TAXONOMY is used.
+    """
+    taxonomy: Any = DEFAULT_TAXONOMY
+    if path:
+        with open(path, encoding="utf-8") as fh:
+            taxonomy = json.load(fh)
+    if isinstance(taxonomy, list):
+        taxonomy = {tag: tag for tag in taxonomy}
+    return tuple((alias.lower().strip(), canonical) for alias, canonical in taxonomy.items())
+
+@lru_cache(maxsize=8)
+def _compile_taxonomy(taxonomy: Tuple[Tuple[str, str], ...]):
+    """
+    Split aliases into single tokens, matched by set intersection with the
+    document's tokens, and phrases ('amazon web services', '.net'), matched
+    by one trie-shaped regex.
+    """
+    aliases = {alias: canonical for alias, canonical in taxonomy}
+    order: Dict[str, int] = {}
+    for _, canonical in taxonomy:
+        order.setdefault(canonical, len(order))
+
+    tokens = frozenset(alias for alias in aliases if _TOKEN_RE.fullmatch(alias))
+    phrases = [alias for alias in aliases if alias not in tokens]
+    phrase_re = None
+    if phrases:
+        # The leading word boundary is checked in _match_tags; a lookbehind
+        # here would disable the regex engine's first-character scan
+        phrase_re = re.compile(r"(?:" + _trie_pattern(phrases) + r")(?![a-z0-9])")
+    return tokens, phrase_re, aliases, order
+
+class CompiledJobNormalizer(JobNormalizer):
+    """
+    JobNormalizer for taxonomy-scale tag sets.
+    Each description is lowercased and split into words once; single-word tags are
+    found by set intersection and phrases and remote keywords by
+    precompiled trie-shaped regexes, so cost grows with description length
+    rather than with the number of tags.
+    Unlike the substring scan, tags match whole words only.
+    """
+
+    _remote_re = re.compile(_trie_pattern(REMOTE_KEYWORDS))
+
+    def __init__(self, taxonomy_path: Optional[str] = None):
+        self._tag_tokens, self._phrase_re, self._aliases, self._tag_order = _compile_taxonomy(
+            load_taxonomy(taxonomy_path)
+        )
+
+    def normalize(self, raw_job: Dict[str, Any]) -> Dict[str, Any]:
+        title = raw_job.get("title", "").strip()
+        company = raw_job.get("company", "").strip()
+        location = raw_job.get("location", "").strip()
+        description = raw_job.get("description", "") or ""
+        desc_lower = description.lower()
+
+        salary_min, salary_max, currency = self._extract_salary(raw_job.get("salary_text", "") or description)
+        is_remote = bool(self._remote_re.search(location.lower()) or self._remote_re.search(desc_lower))
+
+        return {
+            "title": title,
+            "company": company,
+            "location": location,
+            "url": raw_job.get("url"),
+            "description": description,
+            "salary_min": salary_min,
+            "salary_max": salary_max,
+            "currency": currency,
+            "tags": self._match_tags(desc_lower),
+            "is_remote": is_remote,
+            "raw_data": raw_job
+        }
+
+    def _extract_salary(self, text: str) -> tuple[Optional[float], Optional[float], Optional[str]]:
+        if not text:
+            return None, None, None
+        match = _SALARY_RE.search(text)
+        if match:
+            val = float(match.group(1)) * 1000
+            return val, val, "USD"
+        return None, None, None
+
+    def _extract_tags(self, description: str) -> List[str]:
+        return self._match_tags(description.lower()) if description else []
+
+    def _check_remote(self, location: str, description: str) -> bool:
+        return bool(self._remote_re.search(location.lower()) or self._remote_re.search(description.lower()))
+
+    def _match_tags(self, text_lower: str) -> List[str]:
+        if not text_lower:
+            return []
+        words = {word.strip(".") for word in text_lower.translate(_WORD_BREAKS).split()}
+        matched = set(self._tag_tokens.intersection(words))
+        if self._phrase_re is not None:
+            for m in self._phrase_re.finditer(text_lower):
+                start = m.start()
+                # Phrases must stand alone: 'web services' not inside 'myweb services'
+                if start == 0 or not text_lower[start - 1].isalnum():
+                    matched.add(m.group(0))
+        found = {self._aliases[alias] for alias in matched}
+        return sorted(found, key=self._tag_order.__getitem__)
@@ -0,0 +1,93 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.models.job import Job
+from .normalizer import JobNormalizer, CompiledJobNormalizer
+from .deduplicator import JobDeduplicator
+
+logger = logging.getLogger(__name__)
+
+# Per-process singletons so pool workers compile the taxonomy only once
+_normalizers: Dict[Optional[str], JobNormalizer] = {}
+_deduplicator: Optional[JobDeduplicator] = None
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_normalizer(taxonomy_path: Optional[str]) -> JobNormalizer:
+    """
+    The substring-scan JobNormalizer for the built-in tags, where it is several
+    times faster; CompiledJobNormalizer once a taxonomy file
+    (INGEST_TAG_TAXONOMY_PATH) makes the tag set large.
+    """
+    if taxonomy_path not in _normalizers:
+        _normalizers[taxonomy_path] = CompiledJobNormalizer(taxonomy_path) if taxonomy_path else JobNormalizer()
+    return _normalizers[taxonomy_path]
+
+def get_deduplicator() -> JobDeduplicator:
+    global _deduplicator
+    if _deduplicator is None:
+        _deduplicator = JobDeduplicator(settings.NEAR_DUP_NUM_PERM, settings.NEAR_DUP_THRESHOLD)
+    return _deduplicator
+
+def prepare_rows(
+    raw_jobs: List[Dict[str, Any]],
+    source_name: str,
+    source_id: Optional[int],
+    taxonomy_path: Optional[str] = None,
+    near_dup: bool = False,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, bytes]]:
+    """
+    Normalize and hash a chunk of raw postings into Job column mappings,
+    keyed by job_hash and keeping the first occurrence of each hash.
+    With `near_dup`, also returns packed MinHash signatures by job_hash.
+    Pure CPU work with picklable inputs/outputs, so it can run inline or in
+    a pool worker.
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    signatures: Dict[str, bytes] = {}
+    deduplicator = get_deduplicator()
+    valid_keys = Job.__fields__.keys()
+    for clean_data in _get_normalizer(taxonomy_path).normalize_many(raw_jobs):
+        job_hash = deduplicator.generate_hash(clean_data)
+        if job_hash in rows:
+            continue
+        if near_dup:
+            signatures[job_hash] = deduplicator.pack(deduplicator.minhash(clean_data))
+
+        clean_data["job_hash"] = job_hash
+        clean_data["source"] = source_name # Override with official source name
+        clean_data["source_id"] = source_id
+
+        # Filter keys not in the DB model, then let the model fill defaults
+        job = Job(**{k: v for k, v in clean_data.items() if k in valid_keys})
+        rows[job_hash] = {
+            column.name: getattr(job, column.name)
+            for column in Job.__table__.columns
+            if column.name != "id"
+        }
+    return rows, signatures
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Process-wide pool for the normalization stage, sized by
+    INGEST_PROCESS_POOL_SIZE (0 disables it).
+    Daemonic processes (e.g. Celery's default prefork children) cannot
+    spawn children, so there the stage stays inline; run such workers with
+    `--pool=threads` or `--pool=solo` to use the pool.
+    """
+    global _pool
+    if _pool is None and settings.INGEST_PROCESS_POOL_SIZE > 0:
+        if multiprocessing.current_process().daemon:
+            logger.warning("Ingest process pool disabled: running inside a daemonic process")
+            return None
+        _pool = ProcessPoolExecutor(max_workers=settings.INGEST_PROCESS_POOL_SIZE)
+    return _pool
+
+def shutdown_process_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
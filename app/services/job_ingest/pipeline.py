@@ -1,28 +1,112 @@
-from typing import Dict, Any, Type
+from typing import Dict, Any, List, AsyncIterator, Callable, Optional, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
-from datetime import datetime
+from sqlalchemy import delete, or_
+from datetime import datetime, timedelta
+import asyncio
+import logging
 import time
 
-from app.models.job import Job, JobSource, IngestionLog
+from app.core.config import settings
+from app.db.upsert import insert_for
+from app.models.job import Job, JobSource, IngestionLog, SourceFingerprintSet, JobDuplicate, IngestCheckpoint
+from app.services.payload_store import payload_store
 from .base import JobSourceBase
 from .api import APIJobSource
 from .scraper import PlaywrightScraper
-from .normalizer import JobNormalizer
-from .deduplicator import JobDeduplicator
+from .feed import FeedJobSource
+from .fingerprints import PostingFingerprints
+from .parallel import prepare_rows, get_process_pool, get_deduplicator
+from .near_duplicates import NearDuplicateIndex
+from .bloom import get_seen_filter
+from .stats import IngestRunStats
+from .schedule import reschedule
+from .bulk_load import supports_copy, copy_merge_jobs
+
+logger = logging.getLogger(__name__)
+
+# Checkpoints of runs that never finished are dropped after this long
+STALE_CHECKPOINT_AGE = timedelta(days=1)
+
+async def _chunked(
+    jobs: AsyncIterator[Dict[str, Any]], size: int, snapshot: Callable[[], Any]
+) -> AsyncIterator[Tuple[List[Dict[str, Any]], Any]]:
+    """
+    Group a stream of raw postings into lists of at most `size`, each paired
+    with `snapshot()` taken right after its last posting was produced.
+    """
+    chunk: List[Dict[str, Any]] = []
+    async for raw in jobs:
+        chunk.append(raw)
+        if len(chunk) >= size:
+            yield chunk, snapshot()
+            chunk = []
+    if chunk:
+        yield chunk, snapshot()
+
+async def _skip(jobs: AsyncIterator[Dict[str, Any]], count: int) -> AsyncIterator[Dict[str, Any]]:
+    async for raw in jobs:
+        if count:
+            count -= 1
+            continue
+        yield raw
 
 class IngestPipeline:
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        chunk_size: Optional[int] = None,
+        process_pool: Optional[ProcessPoolExecutor] = None,
+        bulk_load: Optional[bool] = None,
+        process_pool_workers: Optional[int] = None,
+    ):
         self.session = session
-        self.normalizer = JobNormalizer()
-        self.deduplicator = JobDeduplicator()
+        # Postings hashed, resolved and inserted per round trip
+        self.chunk_size = chunk_size or settings.INGEST_CHUNK_SIZE
+        # COPY into a staging table + merge for large backfills; other engines
+        # keep the multi-row INSERT
+        bulk_load = settings.INGEST_BULK_LOAD if bulk_load is None else bulk_load
+        self.bulk_load = bulk_load and supports_copy(session)
+        if bulk_load and not self.bulk_load:
+            logger.info("Bulk load requested but not supported by this engine; using INSERT")
+        # Optional pool for the CPU-bound normalize/hash stage
+        self.process_pool = process_pool if process_pool is not None else get_process_pool()
+        # Workers of that pool: a caller-provided pool says how big it is,
+        # the shared one is sized by INGEST_PROCESS_POOL_SIZE
+        self.process_pool_workers = process_pool_workers or settings.INGEST_PROCESS_POOL_SIZE or 1
+        self.seen_filter = get_seen_filter()
+        self.near_duplicates = (
+            NearDuplicateIndex(session, get_deduplicator()) if settings.NEAR_DUP_ENABLED else None
+        )
+        self.stats = IngestRunStats()
 
-    async def run(self, source_id: int):
+    async def run(self, source_id: int, force_rescan: bool = False, run_key: Optional[str] = None):
         """
         Executes the full ingestion pipeline for a given valid Source ID.
+        By default the run is incremental: postings identical to the ones the
+        source served last time are skipped before normalization.
+        `force_rescan` processes everything and rebuilds the fingerprint set.
+
+        With a `run_key` (e.g. the Celery task id) every chunk is committed
+        together with an IngestCheckpoint; if the run fails after some chunks
+        it is logged as 'partial', and running again with the same key
+        resumes after the last committed chunk.
+
+        Returns the status recorded in the run's IngestionLog.
         """
         start_time = time.time()
-        
+        self.stats = IngestRunStats()
+        self.status: Optional[str] = None
+        await self.stats.track_round_trips(self.session)
+        try:
+            await self._run(source_id, force_rescan, start_time, run_key)
+        finally:
+            self.stats.stop_tracking()
+        return self.status
+
+    async def _run(self, source_id: int, force_rescan: bool, start_time: float, run_key: Optional[str]):
         # 1. Load Source Config
         source = await self.session.get(JobSource, source_id)
         if not source:
@@ -34,76 +118,299 @@ class IngestPipeline:
             await self._log_result(source, "failed", error="Invalid Config")
             return
             
+        if force_rescan:
+            # Ignore conditional fetch validators too; we want the full payload
+            strategy.validators = {}
+        else:
+            strategy.all_stored = self._all_stored
+
         try:
-            # 3. Fetch
-            raw_jobs = await strategy.fetch_jobs()
-            
-            dedup_count = 0
-            ingested_count = 0
+            if self.seen_filter:
+                await self.seen_filter.ensure_loaded(self.session)
+
+            fingerprint_row = await self.session.get(SourceFingerprintSet, source.id)
+            previous = ()
+            if fingerprint_row and not force_rescan:
+                previous = PostingFingerprints.load(fingerprint_row.fingerprints)
+            fingerprints = PostingFingerprints(previous)
+
+            checkpoint = await self._load_checkpoint(source.id, run_key) if run_key else None
+            resume_from = checkpoint.position if checkpoint and checkpoint.position else None
+            if resume_from:
+                logger.info(f"Source {source.id}: resuming run {run_key} after {resume_from['consumed']} postings")
+                # Postings committed before the interruption aren't re-read;
+                # keep last run's fingerprints so they still count as seen
+                fingerprints.seen.update(fingerprints.previous)
+
+            found_count = checkpoint.jobs_found if checkpoint else 0
+            dedup_count = checkpoint.jobs_deduplicated if checkpoint else 0
+            ingested_count = checkpoint.jobs_ingested if checkpoint else 0
             
-            for raw in raw_jobs:
-                # 4. Normalize
-                clean_data = self.normalizer.normalize(raw)
-                
-                # 5. Deduplicate
-                job_hash = self.deduplicator.generate_hash(clean_data)
-                
-                # Check DB for hash
-                existing = await self.session.execute(
-                    select(Job).where(Job.job_hash == job_hash)
-                )
-                if existing.scalars().first():
-                    dedup_count += 1
-                    continue
-                
-                # 6. Save
-                clean_data["job_hash"] = job_hash
-                clean_data["source"] = source.name # Override with official source name
-                clean_data["source_id"] = source.id
-                
-                # Remove extra fields not in DB model if any?
-                # Using **clean_data directly requires matching fields.
-                # Use explicit constructor for safety or filter keys.
-                # Assuming Normalizer returns valid keys for JobBase + extras
-                
-                # Filter keys just in case
-                valid_keys = Job.__fields__.keys()
-                db_data = {k: v for k, v in clean_data.items() if k in valid_keys}
-                
-                new_job = Job(**db_data)
-                self.session.add(new_job)
-                ingested_count += 1
+            # 3. Fetch, streaming postings through in bounded chunks
+            chunks = self._prepared_chunks(source, strategy, fingerprints, resume_from)
+            async for chunk_size, (rows, signatures), position in chunks:
+                found_count += chunk_size
+                ingested = await self._persist_rows(rows, signatures) if rows else 0
+                ingested_count += ingested
+                # Unchanged postings count as deduplicated
+                dedup_count += chunk_size - ingested
+
+                if checkpoint:
+                    checkpoint.position = position
+                    checkpoint.jobs_found = found_count
+                    checkpoint.jobs_ingested = ingested_count
+                    checkpoint.jobs_deduplicated = dedup_count
+                    checkpoint.updated_at = datetime.utcnow()
+                    self.session.add(checkpoint)
+                    await self._commit()
+
+            if not strategy.unchanged:
+                if not fingerprint_row:
+                    fingerprint_row = SourceFingerprintSet(source_id=source.id)
+                fingerprint_row.fingerprints = fingerprints.dump()
+                fingerprint_row.count = len(fingerprints.seen)
+                fingerprint_row.updated_at = datetime.utcnow()
+                self.session.add(fingerprint_row)
                 
-            # Update Source Last Run
+            # Update Source Last Run and conditional fetch validators
             source.last_run = datetime.utcnow()
+            source.etag = strategy.validators.get("etag")
+            source.last_modified = strategy.validators.get("last_modified")
+            source.content_digest = strategy.validators.get("content_digest")
             self.session.add(source)
+
+            # Finished; this run's checkpoint is obsolete, and so are ones left
+            # by runs that ran out of retries long ago. Other runs' recent
+            # checkpoints may still be resumed.
+            if run_key:
+                await self.session.execute(
+                    delete(IngestCheckpoint)
+                    .where(IngestCheckpoint.source_id == source.id)
+                    .where(or_(
+                        IngestCheckpoint.run_key == run_key,
+                        IngestCheckpoint.updated_at < datetime.utcnow() - STALE_CHECKPOINT_AGE,
+                    ))
+                )
             
-            await self.session.commit()
+            await self._commit()
+            self._record_transfer(strategy)
             
-            # 7. Log Success
+            # 7. Log Success (or a short-circuited run when nothing changed)
             duration = time.time() - start_time
             await self._log_result(
-                source, "success", 
-                found=len(raw_jobs), 
+                source, "unchanged" if strategy.unchanged else "success", 
+                found=found_count, 
                 ingested=ingested_count, 
                 dedup=dedup_count,
                 duration=duration
             )
             
         except Exception as e:
-            await self.session.rollback()
-            duration = time.time() - start_time
-            await self._log_result(source, "failed", error=str(e), duration=duration)
+            try:
+                await self.session.rollback()
+                # Rollback expires the source; reload it before logging/rescheduling
+                await self.session.refresh(source)
+                self._record_transfer(strategy)
+                duration = time.time() - start_time
+                # Chunks committed under a checkpoint survive the rollback
+                checkpoint = await self._load_checkpoint(source.id, run_key) if run_key else None
+                if checkpoint and checkpoint.position:
+                    await self._log_result(
+                        source, "partial",
+                        found=checkpoint.jobs_found,
+                        ingested=checkpoint.jobs_ingested,
+                        dedup=checkpoint.jobs_deduplicated,
+                        error=str(e),
+                        duration=duration,
+                    )
+                else:
+                    await self._log_result(source, "failed", error=str(e), duration=duration)
+            except Exception as log_error:
+                # The database may be what failed; don't let logging mask the cause
+                logger.error(f"Source {source_id}: could not record the failed run: {log_error}")
             raise e
 
+    async def _prepared_chunks(
+        self,
+        source: JobSource,
+        strategy: JobSourceBase,
+        fingerprints: PostingFingerprints,
+        resume_from: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Tuple[int, Tuple[Dict[str, Dict[str, Any]], Dict[str, bytes]], Dict[str, Any]]]:
+        """
+        Stream (raw chunk size, (prepared rows, signatures), position) in
+        fetch order, where position is the checkpoint to resume right after
+        the chunk.
+        4. Normalize + hash each chunk of new or changed postings. With a
+        process pool the work is submitted as soon as a chunk is fetched and
+        up to two chunks per pool worker stay in flight, so fetching carries
+        on while earlier chunks are normalized and persisted.
+        """
+        loop = asyncio.get_running_loop()
+        max_in_flight = self.process_pool_workers * 2 if self.process_pool else 0
+        pending = deque()
+
+        consumed = 0
+        jobs = None
+        if resume_from:
+            consumed = resume_from["consumed"]
+            state = resume_from.get("source")
+            if state is not None:
+                try:
+                    strategy.resume(state)
+                except NotImplementedError:
+                    state = None
+            if state is None:
+                # No native resume: re-read and skip what was committed
+                jobs = _skip(strategy.iter_jobs(), consumed)
+
+        chunks = _chunked(jobs or strategy.iter_jobs(), self.chunk_size, strategy.checkpoint)
+        while True:
+            with self.stats.stage("fetch"):
+                item = await anext(chunks, None)
+            if item is None:
+                break
+            chunk, source_state = item
+            consumed += len(chunk)
+            position = {"consumed": consumed, "source": source_state}
+
+            with self.stats.stage("normalize"):
+                changed = fingerprints.filter_changed(chunk)
+                args = (
+                    changed, source.name, source.id,
+                    settings.INGEST_TAG_TAXONOMY_PATH, self.near_duplicates is not None,
+                )
+                if self.process_pool and changed:
+                    rows = loop.run_in_executor(self.process_pool, prepare_rows, *args)
+                else:
+                    rows = loop.create_future()
+                    rows.set_result(prepare_rows(*args) if changed else ({}, {}))
+            pending.append((len(chunk), rows, position))
+
+            while len(pending) > max_in_flight:
+                chunk_size, rows, position = pending.popleft()
+                # With a pool this is the time spent waiting on it
+                with self.stats.stage("normalize"):
+                    prepared = await rows
+                yield chunk_size, prepared, position
+
+        while pending:
+            chunk_size, rows, position = pending.popleft()
+            with self.stats.stage("normalize"):
+                prepared = await rows
+            yield chunk_size, prepared, position
+
+    async def _persist_rows(self, rows: Dict[str, Dict[str, Any]], signatures: Dict[str, bytes]) -> int:
+        """
+        Deduplicate and insert one chunk of prepared rows keyed by job_hash.
+        Returns the number of newly ingested jobs; everything else in the
+        chunk was a duplicate (already stored or linked, repeated within the
+        chunk, a near-duplicate, or inserted concurrently by another ingest).
+        """
+        with self.stats.stage("dedup"):
+            # 5. Deduplicate against the DB with a single set-based lookup,
+            # limited to hashes the seen-filter cannot rule out
+            hashes = list(rows.keys())
+            maybe = await self.seen_filter.maybe_present(hashes) if self.seen_filter else hashes
+            if maybe:
+                known = await self._known_hashes(maybe)
+                for known_hash in known:
+                    rows.pop(known_hash, None)
+                if self.seen_filter:
+                    self.seen_filter.record_confirmed(len(maybe), len(known))
+
+            # 5b. Near-duplicates are linked to their canonical job, not stored
+            all_rows, links = rows, []
+            if self.near_duplicates and rows:
+                rows, links = await self.near_duplicates.split(rows, signatures)
+                # A "definitely new" hash matching a stored job this closely may
+                # be an exact copy the (per-process) filter hasn't seen yet
+                unchecked = set(hashes).difference(maybe)
+                suspects = [job_hash for job_hash, _, _ in links if job_hash in unchecked]
+                if suspects:
+                    known = set(await self._known_hashes(suspects))
+                    links = [link for link in links if link[0] not in known]
+
+        with self.stats.stage("persist"):
+            if not rows:
+                if self.seen_filter:
+                    await self.seen_filter.add_many(hashes)
+                return 0
+
+            # 6. Save; ON CONFLICT covers hashes inserted by a concurrent ingest.
+            # Large descriptions / raw postings go to the cold payload store
+            if settings.PAYLOAD_STORE_ENABLED:
+                await payload_store.save(self.session, payload_store.offload(rows.values()))
+            if self.bulk_load:
+                inserted = await copy_merge_jobs(self.session, list(rows.values()))
+                # COPY bypasses the cursor events
+                self.stats.db_round_trips += 1
+            else:
+                stmt = (
+                    insert_for(self.session, Job)
+                    .values(list(rows.values()))
+                    .on_conflict_do_nothing(index_elements=["job_hash"])
+                    .returning(Job.id, Job.job_hash)
+                )
+                inserted = (await self.session.execute(stmt)).all()
+            ids_by_hash = {job_hash: job_id for job_id, job_hash in inserted}
+
+            if self.near_duplicates:
+                await self.near_duplicates.add(ids_by_hash, signatures)
+                await self.near_duplicates.link(links, ids_by_hash, all_rows)
+            if self.seen_filter:
+                # Every hash in the chunk is now stored, linked or lost a race to
+                # a concurrent insert of the same hash
+                await self.seen_filter.add_many(hashes)
+            return len(ids_by_hash)
+
+    async def _load_checkpoint(self, source_id: int, run_key: str) -> IngestCheckpoint:
+        result = await self.session.execute(
+            select(IngestCheckpoint)
+            .where(IngestCheckpoint.source_id == source_id)
+            .where(IngestCheckpoint.run_key == run_key)
+        )
+        return result.scalars().first() or IngestCheckpoint(source_id=source_id, run_key=run_key)
+
+    async def _known_hashes(self, hashes: List[str]) -> List[str]:
+        """Hashes already stored as jobs or linked as near-duplicates."""
+        result = await self.session.execute(
+            select(Job.job_hash).where(Job.job_hash.in_(hashes))
+            .union_all(select(JobDuplicate.job_hash).where(JobDuplicate.job_hash.in_(hashes)))
+        )
+        return result.scalars().all()
+
+    async def _all_stored(self, hashes: List[str]) -> bool:
+        """Whether every hash is already stored or linked; the seen-filter answers most misses."""
+        hashes = list(set(hashes))
+        if self.seen_filter and len(await self.seen_filter.maybe_present(hashes)) < len(hashes):
+            return False
+        return len(set(await self._known_hashes(hashes))) == len(hashes)
+
     def _get_strategy(self, source: JobSource) -> JobSourceBase:
+        validators = {
+            "etag": source.etag,
+            "last_modified": source.last_modified,
+            "content_digest": source.content_digest,
+        }
         if source.type == "api":
-            return APIJobSource(source.config)
+            return APIJobSource(source.config, validators)
         elif source.type == "scraper":
-            return PlaywrightScraper(source.config)
+            return PlaywrightScraper(source.config, validators)
+        elif source.type == "rss":
+            return FeedJobSource(source.config, validators)
         else:
             raise ValueError(f"Unknown source type: {source.type}")
 
+    async def _commit(self):
+        with self.stats.stage("commit"):
+            await self.session.commit()
+        self.stats.db_round_trips += 1
+
+    def _record_transfer(self, strategy: JobSourceBase):
+        self.stats.bytes_fetched = strategy.bytes_fetched
+        self.stats.pages_fetched = strategy.pages_fetched
+
     async def _log_result(self, source: JobSource, status: str, found=0, ingested=0, dedup=0, error=None, duration=0.0):
         log = IngestionLog(
             source_id=source.id,
@@ -112,7 +419,11 @@ class IngestPipeline:
             jobs_ingested=ingested,
             jobs_deduplicated=dedup,
             error_message=error,
-            duration_seconds=duration
+            duration_seconds=duration,
+            **self.stats.as_log_fields()
         )
         self.session.add(log)
+        # Adapt the source's polling interval to this run's yield
+        await reschedule(self.session, source, status)
         await self.session.commit()
+        self.status = status
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.models.job import JobSource
+from .pipeline import IngestPipeline
+from .schedule import claim_due_sources
+
+logger = logging.getLogger(__name__)
+
+class IngestRunner:
+    """
+    Runs the ingestion pipeline for many sources concurrently on one event loop.
+
+    Each source gets its own session and `IngestPipeline` (which writes the
+    per-source `IngestionLog`). A global semaphore bounds the total number of
+    sources in flight and a per-hostname semaphore keeps us polite towards
+    boards that serve several sources.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        max_concurrency: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self._global = asyncio.Semaphore(max_concurrency or settings.INGEST_MAX_CONCURRENCY)
+        per_host = per_host_concurrency or settings.INGEST_PER_HOST_CONCURRENCY
+        self._hosts: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(per_host))
+
+    async def claim_due_source_ids(self, now: Optional[datetime] = None) -> List[int]:
+        """Due sources, claimed so no other scheduler or runner picks them up too."""
+        async with self.session_factory() as session:
+            source_ids = await claim_due_sources(session, now)
+            await session.commit()
+            return source_ids
+
+    async def run_many(self, source_ids: List[int], run_key: Optional[str] = None) -> Dict[int, str]:
+        """
+        Ingest all given sources concurrently. Returns source_id -> status.
+        With a `run_key` (e.g. the Celery task id), each source checkpoints
+        under "<run_key>:<source_id>", so running again with the same key
+        resumes the sources that failed part-way.
+        """
+        statuses = await asyncio.gather(
+            *(self._run_one(source_id, f"{run_key}:{source_id}" if run_key else None) for source_id in source_ids),
+            return_exceptions=True,
+        )
+        for source_id, status in zip(source_ids, statuses):
+            if isinstance(status, BaseException):
+                logger.error(f"Ingestion failed for source_id {source_id}: {status!r}")
+        return {
+            source_id: "failed" if isinstance(status, BaseException) else status
+            for source_id, status in zip(source_ids, statuses)
+        }
+
+    async def _run_one(self, source_id: int, run_key: Optional[str] = None) -> str:
+        try:
+            # Short-lived lookup: queued sources must not pin pool connections
+            async with self.session_factory() as session:
+                source = await session.get(JobSource, source_id)
+                if not source:
+                    return "missing"
+                host = self._host_key(source)
+
+            # Take the host slot first so waiting sources don't pin global slots
+            async with self._hosts[host]:
+                async with self._global:
+                    async with self.session_factory() as session:
+                        # e.g. "failed" for an invalid config, "unchanged" for a 304
+                        return await IngestPipeline(session).run(source_id, run_key=run_key)
+        except Exception as e:
+            # IngestPipeline already logged pipeline failures for this source
+            logger.error(f"Ingestion failed for source_id {source_id}: {e}")
+            return "failed"
+
+    @staticmethod
+    def _host_key(source: JobSource) -> str:
+        url = (source.config or {}).get("url") or source.base_url or ""
+        return (urlparse(url).hostname or "").lower()
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+
+from sqlalchemy import or_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.models.job import JobSource, IngestionLog
+
+def _is_due(now: datetime):
+    return or_(JobSource.next_run_at == None, JobSource.next_run_at <= now)
+
+def due_sources_query(now: datetime, limit: Optional[int] = None):
+    """Active sources whose next run is due, longest overdue first."""
+    query = (
+        select(JobSource.id)
+        .where(JobSource.is_active == True)
+        .where(_is_due(now))
+        # Never-scheduled sources (NULL) first; Postgres sorts NULLs last by default
+        .order_by(JobSource.next_run_at.nulls_first())
+    )
+    return query.limit(limit) if limit else query
+
+async def claim_due_sources(
+    session: AsyncSession, now: Optional[datetime] = None, limit: Optional[int] = None
+) -> List[int]:
+    """
+    Atomically claim due sources by pushing their next_run_at out by the
+    lease, so concurrent schedulers (one per API process) never enqueue the
+    same source twice. The run itself sets the real next_run_at when it logs
+    its result; if it never does, the source is claimed again once the lease
+    expires. The caller commits.
+    """
+    now = now or datetime.utcnow()
+    due = due_sources_query(now, limit or settings.INGEST_SCHEDULER_BATCH_SIZE)
+    stmt = (
+        update(JobSource)
+        # Re-checked against the row after waiting on a concurrent claim
+        .where(_is_due(now))
+        .where(JobSource.id.in_(due.with_for_update(skip_locked=True)))
+        .values(next_run_at=now + timedelta(minutes=settings.INGEST_SCHEDULER_LEASE_MINUTES))
+        .returning(JobSource.id)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
+
+def next_interval(baseline: int, current: int, yields: Sequence[int]) -> int:
+    """
+    Derive a source's interval from the new jobs of its recent runs (newest first).
+    Sources that keep coming back empty back off, high-churn sources are
+    polled more often, and a backed-off source that yields again returns
+    towards its configured baseline.
+    """
+    factor = settings.INGEST_INTERVAL_FACTOR
+    interval = current
+    zero_runs = settings.INGEST_ZERO_YIELD_RUNS
+    if len(yields) >= zero_runs and not any(yields[:zero_runs]):
+        interval = current * factor
+    elif len(yields) >= 2 and min(yields[:2]) >= settings.INGEST_HIGH_CHURN_JOBS:
+        # Two busy runs in a row, so a one-off backlog crawl doesn't count
+        interval = current / factor
+    elif yields and yields[0] > 0 and current > baseline:
+        interval = max(baseline, current / factor)
+    return int(min(max(interval, settings.INGEST_MIN_INTERVAL_MINUTES), settings.INGEST_MAX_INTERVAL_MINUTES))
+
+async def reschedule(session: AsyncSession, source: JobSource, status: str, now: Optional[datetime] = None):
+    """
+    Set the source's next run from the yields in IngestionLog, including the
+    log of the run that just finished. Failed runs keep the current interval;
+    retries are the task's concern. The caller commits.
+    """
+    now = now or datetime.utcnow()
+    current = source.current_interval_minutes or source.interval_minutes
+    if status != "failed":
+        result = await session.execute(
+            select(IngestionLog.jobs_ingested)
+            .where(IngestionLog.source_id == source.id)
+            .where(IngestionLog.status != "failed")
+            .order_by(IngestionLog.created_at.desc(), IngestionLog.id.desc())
+            .limit(settings.INGEST_YIELD_WINDOW)
+        )
+        current = next_interval(source.interval_minutes, current, result.scalars().all())
+
+    source.current_interval_minutes = current
+    source.next_run_at = now + timedelta(minutes=current)
+    session.add(source)
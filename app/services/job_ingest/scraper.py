@@ -1,65 +1,159 @@
-from typing import List, Dict, Any
-from playwright.async_api import async_playwright
+import logging
+from typing import List, Dict, Any, AsyncIterator
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from app.core.config import settings
+from app.services.scraper.browser import browser_pool
+from app.services.scraper.extract import extract_rows
+from app.services.scraper.fetch_profile import FetchProfile, FetchStats
 from .base import JobSourceBase
+from .parallel import get_deduplicator
+
+logger = logging.getLogger(__name__)
+
+PAGINATION_MODES = ("next_button", "url_template", "infinite_scroll")
 
 class PlaywrightScraper(JobSourceBase):
     """
     Headless browser scraper using Playwright.
+
+    Config: url, container_selector and title_selector, plus optional
+    company_selector, location_selector and link_selector (default "a").
+
+    Multi-page boards add a `pagination` block:
+
+        {"mode": "next_button", "next_selector": "a[rel=next]"}
+        {"mode": "url_template", "url_template": "https://example.com/jobs?page={page}", "start": 1}
+        {"mode": "infinite_scroll", "scroll_wait_ms": 2000}
+
+    plus "max_pages" (capped by SCRAPER_MAX_PAGES) and "stop_on_known"
+    (default true). Boards list newest postings first, so crawling stops
+    after the first page whose postings are all stored already.
     """
-    
+
     async def fetch_jobs(self) -> List[Dict[str, Any]]:
+        return [raw async for raw in self.iter_jobs()]
+
+    async def iter_jobs(self) -> AsyncIterator[Dict[str, Any]]:
         url = self.config.get("url")
-        # Selector config
-        container_selector = self.config.get("container_selector") 
-        title_selector = self.config.get("title_selector")
-        company_selector = self.config.get("company_selector")
-        
-        jobs = []
-        
-        async with async_playwright() as p:
-            # Launch browser (could be configured to connect to remote ws)
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            try:
-                await page.goto(url, wait_until="networkidle")
-                
-                # Optional: Handle infinite scroll or pagination logic here
-                
-                # Get elements
-                elements = await page.query_selector_all(container_selector)
-                
-                for el in elements:
-                    title_el = await el.query_selector(title_selector)
-                    company_el = await el.query_selector(company_selector)
-                    link_el = await el.query_selector("a") # assume link is anchor tag inside
-                    
-                    if title_el:
-                        title = await title_el.inner_text()
-                        company = await company_el.inner_text() if company_el else "Unknown"
-                        href = await link_el.get_attribute("href") if link_el else ""
-                        
-                        # Handle relative URLs
-                        if href and not href.startswith("http"):
-                           href = url + href # Simplification
-                        
-                        jobs.append({
-                            "title": title,
-                            "company": company,
-                            "url": href,
-                            "location": "Unknown", # Would need selector
-                            "description": "", # Usually need to visit detail page
-                            "source": "scraper_playwright"
-                        })
-                        
-            except Exception as e:
-                print(f"Scraping error: {e}")
-                # Log error
-            finally:
-                await browser.close()
-                
-        return jobs
+        pagination = self.config.get("pagination") or {}
+        mode = pagination.get("mode")
+        max_pages = min(pagination.get("max_pages", settings.SCRAPER_MAX_PAGES), settings.SCRAPER_MAX_PAGES)
+        stop_on_known = pagination.get("stop_on_known", True) and self.all_stored is not None
+
+        # Per-source allowlists / extra blocks, see FetchProfile
+        profile = FetchProfile.from_config(self.config.get("fetch_profile"))
+        pooled = await browser_pool.checkout(profile)
+        page = pooled.page
+        emitted = 0
+        seen = set() # A next button that cycles back must not re-yield listings
+        try:
+            await page.goto(self._page_url(pagination, 0) if mode == "url_template" else url, wait_until="networkidle")
+            self.pages_fetched += 1
+            extracted = 0 # Containers already read off an infinitely scrolling page
+
+            while True:
+                rows = await self._extract(page, pooled.stats)
+                if mode == "infinite_scroll":
+                    rows, extracted = rows[extracted:], len(rows)
+                jobs = []
+                for job in rows:
+                    key = (job["url"], job["title"])
+                    if job["title"] is not None and key not in seen:
+                        seen.add(key)
+                        jobs.append(job)
+                for job in jobs:
+                    yield job
+                emitted += len(jobs)
+
+                if not mode or not jobs:
+                    break
+                if self.pages_fetched >= max_pages:
+                    logger.info(f"{url}: page budget of {max_pages} reached")
+                    break
+                if stop_on_known and await self.all_stored([get_deduplicator().generate_hash(job) for job in jobs]):
+                    logger.info(f"{url}: page {self.pages_fetched} holds only stored postings, stopping")
+                    break
+                if not await self._next_page(page, pagination, mode, extracted):
+                    break
+                self.pages_fetched += 1
+
+        except Exception:
+            # Re-raised so a crawl cut short is logged as failed/partial, not as a
+            # complete run whose missing pages a later early stop would skip for good
+            logger.exception(f"{url}: scraping failed on page {self.pages_fetched}")
+            raise
+        finally:
+            await browser_pool.checkin(pooled)
+            # Everything the page pulled in, not just the document
+            self.bytes_fetched += pooled.stats.transferred_bytes
+            logger.info(f"Scraped {emitted} listings from {url} in {self.pages_fetched} pages: {pooled.stats.as_log_fields()}")
+
+    async def _extract(self, page: Page, stats: FetchStats) -> List[Dict[str, Any]]:
+        """One row per container, in page order; title is None where the title selector found nothing."""
+        fields = {
+            "title": {"selector": self.config.get("title_selector")},
+            # Container itself when it is the link, else the first match inside; made absolute in the page
+            "url": {"selector": self.config.get("link_selector", "a"), "attr": "href", "resolve": True, "self": True},
+        }
+        if self.config.get("company_selector"):
+            fields["company"] = {"selector": self.config["company_selector"]}
+        if self.config.get("location_selector"):
+            fields["location"] = {"selector": self.config["location_selector"]}
+
+        # One $$eval for every listing instead of several RPCs per element
+        rows = await extract_rows(page, self.config.get("container_selector"), fields, stats=stats)
+        return [
+            {
+                "title": row["title"],
+                "company": row.get("company") or "Unknown",
+                "url": row["url"] or "",
+                "location": row.get("location") or "Unknown",
+                "description": "", # Usually need to visit detail page
+                "source": "scraper_playwright"
+            }
+            for row in rows
+        ]
+
+    def _page_url(self, pagination: Dict[str, Any], index: int) -> str:
+        return pagination["url_template"].format(page=pagination.get("start", 1) + index)
+
+    async def _next_page(self, page: Page, pagination: Dict[str, Any], mode: str, extracted: int) -> bool:
+        """Move `page` on to the next page of listings. False when there is none."""
+        if mode == "url_template":
+            response = await page.goto(self._page_url(pagination, self.pages_fetched), wait_until="networkidle")
+            return response is None or response.ok
+
+        if mode == "next_button":
+            button = await page.query_selector(pagination["next_selector"])
+            if button is None or not await button.is_enabled() or await button.get_attribute("aria-disabled") == "true":
+                return False
+            await button.click()
+            await page.wait_for_load_state("networkidle")
+            return True
+
+        # infinite_scroll: scroll down and wait for more containers to render
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        try:
+            await page.wait_for_function(
+                "([selector, count]) => document.querySelectorAll(selector).length > count",
+                arg=[self.config.get("container_selector"), extracted],
+                timeout=pagination.get("scroll_wait_ms", 2000),
+            )
+        except PlaywrightTimeoutError:
+            return False
+        return True
 
     async def validate_config(self) -> bool:
         required = ["url", "container_selector", "title_selector"]
-        return all(k in self.config for k in required)
+        if not all(k in self.config for k in required):
+            return False
+        pagination = self.config.get("pagination")
+        if pagination:
+            mode = pagination.get("mode")
+            if mode not in PAGINATION_MODES:
+                return False
+            if mode == "next_button" and "next_selector" not in pagination:
+                return False
+            if mode == "url_template" and "{page}" not in pagination.get("url_template", ""):
+                return False
+        return True
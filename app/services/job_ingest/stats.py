@@ -0,0 +1,60 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict
+
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+STAGES = ("fetch", "normalize", "dedup", "persist", "commit")
+
+@dataclass
+class IngestRunStats:
+    """Per-stage wall time and I/O counters for one IngestPipeline.run."""
+    seconds: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+    bytes_fetched: int = 0
+    pages_fetched: int = 0
+    db_round_trips: int = 0
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+
+    async def track_round_trips(self, session: AsyncSession):
+        """
+        Count statements sent by `session`. Listeners are attached to each
+        connection the session begins a transaction on, so other sessions
+        sharing the engine are not counted. COMMITs are counted by the
+        pipeline's commit stage.
+        """
+        def _on_execute(*args):
+            self.db_round_trips += 1
+
+        def _on_begin(sync_session, transaction, connection):
+            if not event.contains(connection, "before_cursor_execute", _on_execute):
+                event.listen(connection, "before_cursor_execute", _on_execute)
+
+        event.listen(session.sync_session, "after_begin", _on_begin)
+        # The session may already be inside a transaction
+        if session.in_transaction():
+            connection = await session.connection()
+            _on_begin(session.sync_session, None, connection.sync_connection)
+        self._untrack = lambda: event.remove(session.sync_session, "after_begin", _on_begin)
+
+    def stop_tracking(self):
+        untrack = getattr(self, "_untrack", None)
+        if untrack:
+            untrack()
+            self._untrack = None
+
+    def as_log_fields(self) -> Dict:
+        return {
+            **{f"{name}_seconds": round(value, 6) for name, value in self.seconds.items()},
+            "bytes_fetched": self.bytes_fetched,
+            "pages_fetched": self.pages_fetched,
+            "db_round_trips": self.db_round_trips,
+        }
@@ -5,6 +5,7 @@ from typing import Optional
 from app.models.resume import Resume
 from app.models.job import Job
 from app.models.match import MatchResult
+from app.services.payload_store import payload_store
 from .features import FeatureExtractor
 from .vectorizer import SimpleVectorizer
 from .ranker import WeightedRanker
@@ -26,6 +27,7 @@ class MatchingEngine:
         
         if not resume or not job:
             raise ValueError("Resume or Job not found")
+        await payload_store.hydrate(self.session, [job], ("description",))
             
         resume_text = resume.extracted_text or ""
         job_text = (job.title or "") + " " + (job.description or "")
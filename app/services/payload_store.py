@@ -0,0 +1,130 @@
+import hashlib
+import json
+import logging
+import zlib
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.upsert import insert_for
+from app.models.job import Job, PayloadBlob
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+except ImportError: # Optional; zlib is always available
+    zstandard = None
+
+PAYLOAD_FIELDS = ("description", "raw_data")
+
+class PayloadStore:
+    """
+    Content-addressed, compressed storage for the large Job columns.
+
+    `offload` moves descriptions and raw postings out of job row mappings into
+    PayloadBlob rows keyed by sha256, so identical descriptions are stored
+    once however many postings share them. The job keeps only the digest and
+    callers that need the text ask for it with `hydrate`.
+    """
+
+    def __init__(self, codec: Optional[str] = None, min_bytes: Optional[int] = None):
+        codec = codec or settings.PAYLOAD_STORE_CODEC
+        if codec == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; compressing payloads with zlib")
+            codec = "zlib"
+        self.codec = codec
+        self.min_bytes = settings.PAYLOAD_STORE_MIN_BYTES if min_bytes is None else min_bytes
+
+    def compress(self, payload: bytes) -> Tuple[str, bytes]:
+        if self.codec == "zstd":
+            return "zstd", zstandard.ZstdCompressor(level=3).compress(payload)
+        return "zlib", zlib.compress(payload, 6)
+
+    @staticmethod
+    def decompress(codec: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("Payload is zstd-compressed but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(data)
+        if codec == "zlib":
+            return zlib.decompress(data)
+        return data
+
+    def offload(self, rows: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Replace large description/raw_data values in Job column mappings with
+        digests. Returns the PayloadBlob rows to save, keyed by digest.
+        """
+        blobs: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            description = row.get("description")
+            raw_data = row.get("raw_data")
+            if raw_data is not None:
+                if description and raw_data.get("description") == description:
+                    # Normalizers copy the description into raw_data; keep one copy
+                    raw_data = {k: v for k, v in raw_data.items() if k != "description"}
+                payload = json.dumps(raw_data, separators=(",", ":"), sort_keys=True, default=str)
+                row["raw_data_digest"] = self._add(blobs, payload.encode())
+                row["raw_data"] = None
+            if description and len(description) >= self.min_bytes:
+                row["description_digest"] = self._add(blobs, description.encode())
+                row["description"] = None
+        return blobs
+
+    def _add(self, blobs: Dict[str, Dict[str, Any]], payload: bytes) -> str:
+        digest = hashlib.sha256(payload).hexdigest()
+        if digest not in blobs:
+            codec, data = self.compress(payload)
+            if len(data) >= len(payload):
+                codec, data = "raw", payload
+            blobs[digest] = {"digest": digest, "codec": codec, "data": data, "size": len(payload)}
+        return digest
+
+    async def save(self, session: AsyncSession, blobs: Dict[str, Dict[str, Any]]):
+        """Insert blobs not stored yet; existing digests already hold the same content."""
+        if not blobs:
+            return
+        await session.execute(
+            insert_for(session, PayloadBlob).values(list(blobs.values())).on_conflict_do_nothing(index_elements=["digest"])
+        )
+
+    async def hydrate(self, session: AsyncSession, jobs: Sequence[Job], fields: Sequence[str] = PAYLOAD_FIELDS):
+        """
+        Load the cold `fields` of `jobs` in one query. Values are set as
+        committed state, so a later commit doesn't write them back inline.
+        """
+        if "raw_data" in fields and "description" not in fields:
+            # raw_data's copy of the description is restored from the job
+            fields = PAYLOAD_FIELDS
+        wanted = [
+            (job, field, getattr(job, f"{field}_digest"))
+            for job in jobs
+            for field in fields
+            if getattr(job, f"{field}_digest") and getattr(job, field) is None
+        ]
+        if not wanted:
+            return
+        result = await session.execute(
+            select(PayloadBlob).where(PayloadBlob.digest.in_({digest for _, _, digest in wanted}))
+        )
+        payloads = {blob.digest: self.decompress(blob.codec, blob.data) for blob in result.scalars().all()}
+
+        # Descriptions first, so raw_data can get its stripped copy back
+        for job, field, digest in sorted(wanted, key=lambda item: PAYLOAD_FIELDS.index(item[1])):
+            payload = payloads.get(digest)
+            if payload is None:
+                logger.warning(f"Missing payload {digest} for job {job.id}")
+                continue
+            if field == "raw_data":
+                value = json.loads(payload)
+                if job.description and "description" not in value:
+                    value["description"] = job.description
+            else:
+                value = payload.decode()
+            set_committed_value(job, field, value)
+
+payload_store = PayloadStore()
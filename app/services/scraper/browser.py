@@ -1,42 +1,278 @@
-from playwright.async_api import async_playwright
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Request, Route
+
+from app.core.config import settings
+from app.services.scraper.fetch_profile import FetchProfile, FetchStats
 
 logger = logging.getLogger(__name__)
 
-class BrowserManager:
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+VIEWPORT = {"width": 1280, "height": 800}
+
+@dataclass
+class PooledPage:
+    """A checked-out browser context and its page."""
+    context: BrowserContext
+    page: Page
+    uses: int = 0
+    stats: FetchStats = field(default_factory=FetchStats)
+    _sizing: Set[asyncio.Task] = field(default_factory=set)
+
+class BrowserPool:
     """
-    Manages the Playwright browser instance.
+    One Chromium per process, shared by the scrapers, the ingest scraper
+    source and auto-apply.
+
+    Contexts are expensive compared to pages but cheap compared to a browser
+    launch, so a bounded set of context + page pairs is kept warm. `page()`
+    (or `checkout`/`checkin`) hands one out, waiting while `size` are in use.
+    On checkin the context's cookies and permissions are cleared and the page
+    is sent to about:blank; after `max_uses` checkouts, or when a use fails,
+    the context is closed and replaced instead, so state that can't be reset
+    cheaply (local storage, caches, leaked listeners) doesn't build up.
+    Auto-apply checks its pages in with `discard`, so a context that held an
+    applicant's session never serves another use.
+
+    A FetchProfile passed to `checkout`/`page()` is installed as a request
+    route for that use only; `stats` on the checked-out page counts the
+    bytes transferred and the requests the profile aborted.
+
+    Like the HTTP client registry, Playwright objects belong to the event
+    loop they were created on; a pool first used on a different loop shuts
+    down the previous browser and driver and starts over.
     """
-    def __init__(self):
-        self.playwright = None
-        self.browser = None
+
+    def __init__(self, size: Optional[int] = None, max_uses: Optional[int] = None, prewarm: Optional[int] = None):
+        self.size = size or settings.BROWSER_POOL_SIZE
+        self.max_uses = max_uses or settings.BROWSER_POOL_MAX_USES
+        self.prewarm = min(settings.BROWSER_POOL_PREWARM if prewarm is None else prewarm, self.size)
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._idle: List[PooledPage] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_use = 0
+        self._recycled = 0
+        self._totals = FetchStats()
+
+    async def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        old_loop, browser, playwright = self._loop, self._browser, self._playwright
+        self._playwright = None
+        self._browser = None
+        self._idle = []
+        self._in_use = 0
+        self._slots = asyncio.Semaphore(self.size)
+        self._lock = asyncio.Lock()
+        self._loop = loop
+        if playwright is not None:
+            logger.info("Event loop changed; closing the browser pool from the previous loop")
+            await self._close_stale(old_loop, browser, playwright)
+
+    async def _close_stale(self, old_loop: asyncio.AbstractEventLoop, browser: Optional[Browser], playwright):
+        """Shut down a browser and Playwright driver left behind on a previous event loop."""
+        try:
+            # Playwright's connection only makes progress on its own loop
+            if old_loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._shutdown(browser, playwright), old_loop))
+            elif not old_loop.is_closed():
+                await asyncio.to_thread(old_loop.run_until_complete, self._shutdown(browser, playwright))
+            else:
+                # Nothing can run on a closed loop. The driver exits (closing
+                # the browsers it launched) once its stdin is closed
+                playwright._impl_obj._connection._transport._proc._transport._proc.stdin.close()
+        except Exception as e:
+            logger.warning(f"Could not close the browser from the previous event loop: {e}")
+
+    @staticmethod
+    async def _shutdown(browser: Optional[Browser], playwright):
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass # Already disconnected
+        await playwright.stop()
 
     async def start(self):
-        if not self.playwright:
-            self.playwright = await async_playwright().start()
-            # Launch chromium in headless mode
-            # args can be added to reduce detection, e.g. --disable-blink-features=AutomationControlled
-            self.browser = await self.playwright.chromium.launch(
+        """Launch the browser (if needed) and prewarm contexts."""
+        await self._bind_loop()
+        await self._ensure_browser()
+        while len(self._idle) < self.prewarm:
+            self._idle.append(await self._new_page())
+
+    async def _ensure_browser(self) -> Browser:
+        async with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._browser is not None:
+                logger.warning("Browser disconnected; relaunching")
+                self._idle = []
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
                 headless=True,
                 args=["--no-sandbox", "--disable-setuid-sandbox", "--disable-blink-features=AutomationControlled"]
             )
-            logger.info("Browser started")
-
-    async def get_page(self):
-        if not self.browser:
-            await self.start()
-        
-        context = await self.browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        page = await context.new_page()
-        return page, context
+            logger.info(f"Browser started (pool size {self.size})")
+            return self._browser
+
+    async def _new_page(self) -> PooledPage:
+        browser = await self._ensure_browser()
+        context = await browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+        try:
+            page = await context.new_page()
+        except BaseException:
+            await self._close_context(context)
+            raise
+        pooled = PooledPage(context=context, page=page)
+        page.on("requestfinished", lambda request: self._finished(pooled, request))
+        return pooled
+
+    def _finished(self, pooled: PooledPage, request: Request):
+        stats = pooled.stats
+        stats.requests += 1
+
+        async def _count():
+            try:
+                sizes = await request.sizes()
+                stats.transferred_bytes += sizes["responseHeadersSize"] + sizes["responseBodySize"]
+            except Exception:
+                pass # Page navigated away or closed first
+
+        task = asyncio.ensure_future(_count())
+        pooled._sizing.add(task)
+        task.add_done_callback(pooled._sizing.discard)
+
+    async def checkout(self, profile: Optional[FetchProfile] = None) -> PooledPage:
+        """Wait for a free slot and return a clean context + page. Pair with `checkin`."""
+        await self._bind_loop()
+        await self._slots.acquire()
+        pooled = None
+        try:
+            await self._ensure_browser()
+            pooled = self._idle.pop() if self._idle else await self._new_page()
+            pooled.stats = FetchStats()
+            if profile is not None and profile.enabled:
+                await self._block(pooled, profile)
+        except BaseException:
+            # A context whose route setup failed is in an unknown state
+            if pooled is not None:
+                self._recycled += 1
+                await self._close_context(pooled.context)
+            self._slots.release()
+            raise
+        pooled.uses += 1
+        self._in_use += 1
+        return pooled
+
+    async def _block(self, pooled: PooledPage, profile: FetchProfile):
+        stats = pooled.stats
+
+        async def _route(route: Route):
+            request = route.request
+            if profile.blocks(request.resource_type, request.url):
+                stats.blocked_requests += 1
+                stats.blocked_by_type[request.resource_type] += 1
+                await route.abort("blockedbyclient")
+            else:
+                await route.continue_()
+
+        await pooled.page.route("**/*", _route)
+
+    async def _settle(self, pooled: PooledPage):
+        # Response sizes still being read for this use
+        if pooled._sizing:
+            await asyncio.gather(*pooled._sizing, return_exceptions=True)
+        stats = pooled.stats
+        self._totals.requests += stats.requests
+        self._totals.transferred_bytes += stats.transferred_bytes
+        self._totals.blocked_requests += stats.blocked_requests
+        self._totals.blocked_by_type.update(stats.blocked_by_type)
+        self._totals.extract_seconds += stats.extract_seconds
+
+    async def checkin(self, pooled: PooledPage, discard: bool = False):
+        """Return a checked-out page. `discard` closes its context instead of reusing it."""
+        try:
+            await self._settle(pooled)
+            if not discard and pooled.uses < self.max_uses and self._browser is not None and self._browser.is_connected():
+                try:
+                    await self._reset(pooled)
+                    self._idle.append(pooled)
+                    return
+                except Exception as e:
+                    logger.warning(f"Browser context reset failed, recycling it: {e}")
+            self._recycled += 1
+            await self._close_context(pooled.context)
+        finally:
+            self._in_use -= 1
+            self._slots.release()
+
+    @staticmethod
+    async def _close_context(context: BrowserContext):
+        try:
+            await context.close()
+        except Exception:
+            pass # Browser already gone
+
+    async def _reset(self, pooled: PooledPage):
+        await pooled.page.unroute_all(behavior="ignoreErrors")
+        # Pages opened by the site (popups, target=_blank) go with the use
+        for extra in pooled.context.pages:
+            if extra is not pooled.page:
+                await extra.close()
+        await pooled.page.goto("about:blank")
+        await pooled.context.clear_cookies()
+        await pooled.context.clear_permissions()
+
+    @asynccontextmanager
+    async def page(self, profile: Optional[FetchProfile] = None) -> AsyncIterator[Page]:
+        """Check a page out for the duration of the block."""
+        pooled = await self.checkout(profile)
+        failed = False
+        try:
+            yield pooled.page
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self.checkin(pooled, discard=failed)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool occupancy, plus requests, bytes and blocked requests summed over every checked-in use."""
+        return {
+            "size": self.size,
+            "in_use": self._in_use,
+            "idle": len(self._idle),
+            "recycled": self._recycled,
+            "connected": int(self._browser is not None and self._browser.is_connected()),
+            **self._totals.as_log_fields(),
+        }
 
     async def stop(self):
-        if self.browser:
-            await self.browser.close()
-        if self.playwright:
-            await self.playwright.stop()
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._close_context(pooled.context)
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
         logger.info("Browser stopped")
 
-browser_manager = BrowserManager()
+    def close(self):
+        """Synchronous stop for shutdown hooks that run outside the event loop."""
+        loop = self._loop
+        if self._browser is None or loop is None or loop.is_closed() or loop.is_running():
+            return
+        loop.run_until_complete(self.stop())
+
+browser_pool = BrowserPool()
@@ -1,128 +1,211 @@
+import asyncio
 import hashlib
+import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict
-from bs4 import BeautifulSoup
-from app.services.scraper.browser import browser_manager
+from typing import Any, List, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+from app.core.http import http_clients
+from app.services.scraper.browser import browser_pool, PooledPage
+from app.services.scraper.extract import extract_rows
+from app.services.scraper.fetch_profile import FetchProfile, FetchStats
+from app.services.scraper.parsers import parse_greenhouse_board, parse_lever_board
+
+logger = logging.getLogger(__name__)
 
 class BaseScraper(ABC):
-    def __init__(self, base_url: str, company_name: str):
+    # Scraper-specific additions to the default fetch profile
+    FETCH_PROFILE: Dict[str, Any] = {}
+
+    def __init__(self, base_url: str, company_name: str, fetch_profile: Optional[Dict[str, Any]] = None):
         self.base_url = base_url
         self.company_name = company_name
+        # Per-source allowlists / extra blocks, see FetchProfile
+        self.fetch_profile = FetchProfile.from_config(fetch_profile, base=self.FETCH_PROFILE)
+        self.fetch_stats: Optional[FetchStats] = None
+
+    async def checkin(self, pooled: PooledPage):
+        await browser_pool.checkin(pooled)
+        self.fetch_stats = pooled.stats
+        logger.info(f"Fetched {self.base_url}: {pooled.stats.as_log_fields()}")
 
     def generate_id(self, url: str) -> str:
         return hashlib.md5(url.encode()).hexdigest()
 
-    @abstractmethod
     async def scrape(self) -> List[Dict]:
+        """Try the browserless fast path first; render the page only when it can't answer."""
+        try:
+            jobs = await self.scrape_http()
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed for {self.base_url}, falling back to the browser: {e}")
+            jobs = None
+        if jobs is not None:
+            return jobs
+        return await self.scrape_browser()
+
+    async def scrape_http(self) -> Optional[List[Dict]]:
+        """Board listing without a browser, or None when this board has no such path."""
+        return None
+
+    @abstractmethod
+    async def scrape_browser(self) -> List[Dict]:
         pass
 
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """GET a JSON document on the shared HTTP pool. None on 404 (unknown board)."""
+        resp = await http_clients.get(url).get(url, params=params, headers={"Accept": "application/json"})
+        self.fetch_stats = FetchStats(requests=1, transferred_bytes=resp.num_bytes_downloaded)
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        logger.info(f"Fetched {self.base_url} over HTTP: {self.fetch_stats.as_log_fields()}")
+        return resp.json()
+
+def _board_slug(base_url: str, hosts: tuple) -> Optional[str]:
+    """First path segment of a hosted board URL, e.g. boards.greenhouse.io/{slug}."""
+    parts = urlsplit(base_url)
+    if not parts.netloc.lower().endswith(hosts):
+        return None
+    # Embedded boards: /embed/job_board?for={slug}
+    slug = parse_qs(parts.query).get("for", [None])[0]
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if not slug and segments and segments[0] != "embed":
+        slug = segments[0]
+    return slug
+
 class GreenhouseScraper(BaseScraper):
-    async def scrape(self) -> List[Dict]:
-        page, context = await browser_manager.get_page()
+    # Server-rendered board parsed from the HTML; styles aren't needed
+    FETCH_PROFILE = {"block_types": ["stylesheet"]}
+
+    async def scrape_http(self) -> Optional[List[Dict]]:
+        # Public Job Board API: https://developers.greenhouse.io/job-board.html
+        token = _board_slug(self.base_url, ("greenhouse.io",))
+        if not token:
+            return None
+        host = "boards-api.eu.greenhouse.io" if ".eu." in urlsplit(self.base_url).netloc else "boards-api.greenhouse.io"
+        data = await self.get_json(f"https://{host}/v1/boards/{token}/jobs")
+        if data is None:
+            return None
+        jobs = []
+        for post in data.get("jobs", []):
+            url = post.get("absolute_url")
+            if not url:
+                continue
+            jobs.append({
+                "title": (post.get("title") or "").strip(),
+                "company": self.company_name,
+                "url": url,
+                "location": ((post.get("location") or {}).get("name") or "").strip() or "Remote",
+                "job_hash": self.generate_id(url),
+                "source": "Greenhouse"
+            })
+        return jobs
+
+    async def scrape_browser(self) -> List[Dict]:
+        pooled = await browser_pool.checkout(self.fetch_profile)
+        page = pooled.page
         jobs = []
         try:
             # Greenhouse often embeds in id="grnhse_app" or just lists
             # A common pattern: https://boards.greenhouse.io/{company}
             await page.goto(self.base_url, wait_until="networkidle")
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Generic Greenhouse selector (may vary slightly)
-            job_posts = soup.find_all('div', class_='opening') 
-            if not job_posts:
-                 job_posts = soup.find_all('section', class_='level-0')
-
-            for post in job_posts:
-                link = post.find('a')
-                if link:
-                    title = link.get_text(strip=True)
-                    url = link.get('href')
-                    if not url.startswith('http'):
-                        url = f"https://boards.greenhouse.io{url}"
-                    
-                    location_div = post.find('span', class_='location')
-                    location = location_div.get_text(strip=True) if location_div else "Remote"
-                    
-                    jobs.append({
-                        "title": title,
-                        "company": self.company_name,
-                        "url": url,
-                        "location": location,
-                        "job_hash": self.generate_id(url),
-                        "source": "Greenhouse"
-                    })
+            # Parsed off the event loop; big boards take tens of ms
+            for post in await asyncio.to_thread(parse_greenhouse_board, content):
+                jobs.append({
+                    "title": post["title"],
+                    "company": self.company_name,
+                    "url": post["url"],
+                    "location": post["location"],
+                    "job_hash": self.generate_id(post["url"]),
+                    "source": "Greenhouse"
+                })
         except Exception as e:
             print(f"Error scraping {self.base_url}: {e}")
         finally:
-            await context.close()
+            await self.checkin(pooled)
         return jobs
 
 class LeverScraper(BaseScraper):
-    async def scrape(self) -> List[Dict]:
-        page, context = await browser_manager.get_page()
+    FETCH_PROFILE = {"block_types": ["stylesheet"]}
+
+    async def scrape_http(self) -> Optional[List[Dict]]:
+        # Public Postings API: https://github.com/lever/postings-api
+        company = _board_slug(self.base_url, ("lever.co",))
+        if not company:
+            return None
+        host = "api.eu.lever.co" if ".eu." in urlsplit(self.base_url).netloc else "api.lever.co"
+        data = await self.get_json(f"https://{host}/v0/postings/{company}", params={"mode": "json"})
+        if data is None:
+            return None
+        jobs = []
+        for post in data:
+            url = post.get("hostedUrl")
+            if not url:
+                continue
+            jobs.append({
+                "title": (post.get("text") or "").strip() or "Unknown",
+                "company": self.company_name,
+                "url": url,
+                "location": ((post.get("categories") or {}).get("location") or "").strip() or "Remote",
+                "job_hash": self.generate_id(url),
+                "source": "Lever"
+            })
+        return jobs
+
+    async def scrape_browser(self) -> List[Dict]:
+        pooled = await browser_pool.checkout(self.fetch_profile)
+        page = pooled.page
         jobs = []
         try:
             # Lever pattern: https://jobs.lever.co/{company}
             await page.goto(self.base_url, wait_until="networkidle")
             content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            job_posts = soup.find_all('a', class_='posting-title')
-            
-            for post in job_posts:
-                title_h5 = post.find('h5')
-                title = title_h5.get_text(strip=True) if title_h5 else "Unknown"
-                url = post.get('href')
-                
-                # Location often in a span
-                meta = post.find('span', class_='sort-by-location')
-                location = meta.get_text(strip=True) if meta else "Remote"
-
+            for post in await asyncio.to_thread(parse_lever_board, content):
                 jobs.append({
-                    "title": title,
+                    "title": post["title"],
                     "company": self.company_name,
-                    "url": url,
-                    "location": location,
-                    "job_hash": self.generate_id(url),
+                    "url": post["url"],
+                    "location": post["location"],
+                    "job_hash": self.generate_id(post["url"]),
                     "source": "Lever"
                 })
         except Exception as e:
             print(f"Error scraping {self.base_url}: {e}")
         finally:
-            await context.close()
+            await self.checkin(pooled)
         return jobs
 
 class GenericScraper(BaseScraper):
     """
     Experimental generic scraper for simple career pages.
     """
-    async def scrape(self) -> List[Dict]:
-        page, context = await browser_manager.get_page()
+    async def scrape_browser(self) -> List[Dict]:
+        pooled = await browser_pool.checkout(self.fetch_profile)
+        page = pooled.page
         jobs = []
         try:
             await page.goto(self.base_url, wait_until="networkidle")
             # Heuristic: Find all links that contain "apply" or "job" or "career"
-            links = await page.query_selector_all("a")
+            links = await extract_rows(page, "a", {
+                "text": {},
+                "href": {"attr": "href"},
+                "url": {"attr": "href", "resolve": True},
+            }, stats=pooled.stats)
             
             for link in links:
-                text = await link.inner_text()
-                href = await link.get_attribute("href")
+                text, href, url = link["text"], link["href"], link["url"]
                 
-                if href and ("apply" in href.lower() or "job" in href.lower() or "career" in href.lower()):
-                     if not href.startswith("http"):
-                         # simplistic join
-                         href = self.base_url + href
-                     
+                if href and url and url.startswith("http") and ("apply" in href.lower() or "job" in href.lower() or "career" in href.lower()):
                      jobs.append({
                         "title": text[:100] if text else "Unknown Job",
                         "company": self.company_name,
-                        "url": href,
+                        "url": url,
                         "location": "Unknown",
-                        "job_hash": self.generate_id(href),
+                        "job_hash": self.generate_id(url),
                         "source": "Generic"
                     })
         except Exception as e:
             print(f"Error scraping {self.base_url}: {e}")
         finally:
-            await context.close()
+            await self.checkin(pooled)
         return jobs
@@ -0,0 +1,91 @@
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from fnmatch import translate
+from typing import Any, Dict, Iterable, Optional, Pattern, Sequence
+
+from app.core.config import settings
+
+def _compile(patterns: Iterable[str]) -> Optional[Pattern]:
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{translate(p)})" for p in patterns), re.IGNORECASE)
+
+class FetchProfile:
+    """
+    Which requests a scraper page may make.
+
+    Requests whose resource type (Playwright's `request.resource_type`) is in
+    `block_types`, or whose URL matches a `block_patterns` glob, are aborted
+    before they leave the browser, unless the URL matches an
+    `allow_patterns` glob or the type is in `allow_types`. Listing pages
+    don't need images, fonts, media or analytics beacons to render their
+    HTML, and `networkidle` no longer waits on them.
+
+    Sources narrow the defaults with an allowlist, e.g. a careers page
+    whose listings are drawn from a stylesheet-driven widget:
+
+        {"fetch_profile": {"allow_types": ["font"], "allow_patterns": ["*cdn.example.com/*"],
+                           "block_patterns": ["*intercom.io/*"]}}
+    """
+
+    def __init__(
+        self,
+        block_types: Optional[Iterable[str]] = None,
+        block_patterns: Optional[Iterable[str]] = None,
+        allow_types: Iterable[str] = (),
+        allow_patterns: Iterable[str] = (),
+        enabled: Optional[bool] = None,
+    ):
+        block_types = settings.SCRAPER_BLOCKED_RESOURCE_TYPES if block_types is None else block_types
+        block_patterns = settings.SCRAPER_BLOCKED_URL_PATTERNS if block_patterns is None else block_patterns
+        self.enabled = settings.SCRAPER_BLOCK_REQUESTS if enabled is None else enabled
+        self.block_types = frozenset(block_types) - frozenset(allow_types)
+        self._block = _compile(block_patterns)
+        self._allow = _compile(allow_patterns)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]], base: Optional[Dict[str, Sequence[str]]] = None) -> "FetchProfile":
+        """
+        Build a profile from a source's `fetch_profile` config. Extra block
+        patterns and allowlists add to `base` (a scraper's own overrides) and
+        the global defaults rather than replacing them.
+        """
+        merged: Dict[str, Any] = {key: list(value) for key, value in (base or {}).items()}
+        for key, value in (config or {}).items():
+            if key == "enabled":
+                merged[key] = bool(value)
+            else:
+                merged[key] = merged.get(key, []) + list(value)
+        if "block_patterns" in merged:
+            merged["block_patterns"] = list(settings.SCRAPER_BLOCKED_URL_PATTERNS) + merged["block_patterns"]
+        if "block_types" in merged:
+            merged["block_types"] = list(settings.SCRAPER_BLOCKED_RESOURCE_TYPES) + merged["block_types"]
+        return cls(**merged)
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        if not self.enabled or url.startswith("data:"):
+            return False
+        if self._allow is not None and self._allow.match(url):
+            return False
+        return resource_type in self.block_types or (self._block is not None and self._block.match(url) is not None)
+
+@dataclass
+class FetchStats:
+    """Requests made and aborted while a page was checked out."""
+    requests: int = 0
+    transferred_bytes: int = 0
+    blocked_requests: int = 0
+    blocked_by_type: Counter = field(default_factory=Counter)
+    # Time spent reading listings out of the DOM
+    extract_seconds: float = 0.0
+
+    def as_log_fields(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "transferred_bytes": self.transferred_bytes,
+            "blocked_requests": self.blocked_requests,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "extract_seconds": round(self.extract_seconds, 4),
+        }
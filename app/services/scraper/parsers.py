@@ -0,0 +1,176 @@
+"""
+Listing and detail-page parsers for board HTML.
+
+Plain functions over an HTML string, so crawlers can run them in a worker
+thread (`asyncio.to_thread`) instead of on the event loop; lxml releases the
+GIL while it parses. Selectors are compiled to XPath once, at import.
+"""
+import html
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from lxml.etree import ParserError
+
+GREENHOUSE_ORIGIN = "https://boards.greenhouse.io"
+
+_GREENHOUSE_OPENINGS = CSSSelector("div.opening")
+_GREENHOUSE_SECTIONS = CSSSelector("section.level-0")
+_GREENHOUSE_LOCATION = CSSSelector("span.location")
+_LEVER_POSTINGS = CSSSelector("a.posting-title")
+_LEVER_TITLE = CSSSelector("h5")
+_LEVER_LOCATION = CSSSelector("span.sort-by-location")
+_ANCHOR = CSSSelector("a")
+
+def _document(content: str):
+    try:
+        return lxml_html.document_fromstring(content)
+    except ParserError: # Empty document
+        return None
+
+def _text(element) -> str:
+    # Same as BeautifulSoup's get_text(strip=True): every text node stripped, then joined
+    return "".join(part.strip() for part in element.itertext())
+
+def _first(selector: CSSSelector, element) -> Optional[object]:
+    found = selector(element)
+    return found[0] if found else None
+
+def parse_greenhouse_board(content: str) -> List[Dict[str, str]]:
+    """title/url/location of every opening on a hosted Greenhouse board."""
+    doc = _document(content)
+    if doc is None:
+        return []
+    posts = _GREENHOUSE_OPENINGS(doc) or _GREENHOUSE_SECTIONS(doc)
+    postings = []
+    for post in posts:
+        link = _first(_ANCHOR, post)
+        url = link.get("href") if link is not None else None
+        if not url:
+            continue
+        if not url.startswith("http"):
+            url = f"{GREENHOUSE_ORIGIN}{url}"
+        location = _first(_GREENHOUSE_LOCATION, post)
+        postings.append({
+            "title": _text(link),
+            "url": url,
+            "location": _text(location) if location is not None else "Remote",
+        })
+    return postings
+
+def parse_lever_board(content: str) -> List[Dict[str, str]]:
+    """title/url/location of every posting on a hosted Lever board."""
+    doc = _document(content)
+    if doc is None:
+        return []
+    postings = []
+    for post in _LEVER_POSTINGS(doc):
+        url = post.get("href")
+        if not url:
+            continue
+        title = _first(_LEVER_TITLE, post)
+        location = _first(_LEVER_LOCATION, post)
+        postings.append({
+            "title": _text(title) if title is not None else "Unknown",
+            "url": url,
+            "location": _text(location) if location is not None else "Remote",
+        })
+    return postings
+
+_JSON_LD = CSSSelector("script[type='application/ld+json']")
+# Description containers of common ATS detail pages, most specific first
+_DETAIL_DESCRIPTION = [CSSSelector(css) for css in (
+    "[data-qa='job-description']", ".job__description", "#job-description", ".job-description",
+    ".posting-page .section-wrapper", "#content", "article", "main",
+)]
+_DETAIL_LOCATION = [CSSSelector(css) for css in (
+    ".job__location", ".posting-categories .location", ".location", "[data-qa='job-location']",
+)]
+_NOISE = CSSSelector("script, style, noscript, nav, header, footer, form, svg")
+_BLOCK_TAGS = {"p", "div", "li", "br", "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "section", "tr"}
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+
+def _block_text(element) -> str:
+    """Readable text of an element, one line per block element."""
+    for noise in _NOISE(element):
+        noise.drop_tree()
+    parts = []
+    for node in element.iter():
+        if isinstance(node.tag, str) and node.tag in _BLOCK_TAGS:
+            parts.append("\n")
+        if node.text and isinstance(node.tag, str):
+            parts.append(node.text)
+        if node.tail and node is not element:
+            parts.append(node.tail)
+    lines = (" ".join(line.split()) for line in "".join(parts).splitlines())
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+def _job_postings(data: Any):
+    """JobPosting objects anywhere in a JSON-LD document (lists and @graph included)."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _job_postings(item)
+    elif isinstance(data, dict):
+        kind = data.get("@type")
+        if kind == "JobPosting" or (isinstance(kind, list) and "JobPosting" in kind):
+            yield data
+        yield from _job_postings(data.get("@graph", []))
+
+def _ld_location(posting: Dict[str, Any]) -> str:
+    if posting.get("jobLocationType") == "TELECOMMUTE":
+        return "Remote"
+    places = posting.get("jobLocation") or []
+    for place in places if isinstance(places, list) else [places]:
+        address = place.get("address") if isinstance(place, dict) else None
+        if isinstance(address, dict):
+            country = address.get("addressCountry")
+            if isinstance(country, dict):
+                country = country.get("name")
+            parts = [address.get("addressLocality"), address.get("addressRegion"), country]
+            location = ", ".join(part.strip() for part in parts if isinstance(part, str) and part.strip())
+            if location:
+                return location
+    return ""
+
+def parse_job_detail(content: str) -> Dict[str, str]:
+    """
+    description (plain text) and location of a job detail page. schema.org
+    JobPosting JSON-LD wins; otherwise the first known description and
+    location containers are read. Missing fields are empty strings.
+    """
+    doc = _document(content)
+    if doc is None:
+        return {"description": "", "location": ""}
+
+    description, location = "", ""
+    for script in _JSON_LD(doc):
+        try:
+            data = json.loads(script.text or "")
+        except ValueError:
+            continue
+        for posting in _job_postings(data):
+            markup = posting.get("description") or ""
+            if "<" not in markup:
+                # Often entity-escaped HTML
+                markup = html.unescape(markup)
+            if markup and not description:
+                fragment = _document(f"<div>{markup}</div>")
+                description = _block_text(fragment.body) if fragment is not None else ""
+            location = location or _ld_location(posting)
+
+    if not description:
+        for selector in _DETAIL_DESCRIPTION:
+            found = _first(selector, doc)
+            if found is not None:
+                description = _block_text(found)
+                if description:
+                    break
+    if not location:
+        for selector in _DETAIL_LOCATION:
+            found = _first(selector, doc)
+            if found is not None and _text(found):
+                location = " ".join(found.text_content().split())
+                break
+    return {"description": description, "location": location}
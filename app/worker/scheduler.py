@@ -1,16 +1,69 @@
+import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-# from app.workers.job_ingest_worker import run_ingestion_task # Future integration
+from sqlalchemy.orm import sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.db.session import engine
+from app.services.job_ingest.schedule import claim_due_sources
+from app.workers.enrichment_worker import run_enrichment_task
+from app.workers.job_ingest_worker import run_due_ingestions_task
+
+logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
 
+async def enqueue_due_sources():
+    """
+    Claim the job sources whose next run is due and hand them to a worker.
+    Each run reschedules its source from its yield (see job_ingest/schedule.py),
+    so this only has to poll for due rows.
+    """
+    async_session = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with async_session() as session:
+        source_ids = await claim_due_sources(session)
+        await session.commit()
+
+    # A whole batch in one task would overrun task_soft_time_limit
+    size = settings.INGEST_SCHEDULER_SOURCES_PER_TASK
+    for start in range(0, len(source_ids), size):
+        run_due_ingestions_task.delay(source_ids=source_ids[start:start + size])
+    if source_ids:
+        logger.info(f"Enqueued ingestion for {len(source_ids)} due sources")
+
+async def enqueue_enrichment():
+    """
+    Hand the detail-page enrichment crawler its next batch. The task claims
+    its own jobs, so overlapping ticks never fetch the same page.
+    """
+    run_enrichment_task.delay()
+
 def start_scheduler():
-    # Example daily job logic would go here.
-    # Currently, ingestion is triggered via API or Celery Beats (if configured).
-    
-    # if not scheduler.running:
-    #     scheduler.start()
-    #     print("Scheduler started...")
-    pass
+    if not settings.INGEST_SCHEDULER_ENABLED or scheduler.running:
+        return
+    scheduler.add_job(
+        enqueue_due_sources,
+        "interval",
+        seconds=settings.INGEST_SCHEDULER_TICK_SECONDS,
+        id="enqueue_due_sources",
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True,
+    )
+    if settings.ENRICH_ENABLED:
+        scheduler.add_job(
+            enqueue_enrichment,
+            "interval",
+            seconds=settings.ENRICH_TICK_SECONDS,
+            id="enqueue_enrichment",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
+    scheduler.start()
+    logger.info("Scheduler started...")
 
 async def stop_scheduler():
     if scheduler.running:
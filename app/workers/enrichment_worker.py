@@ -0,0 +1,33 @@
+import asyncio
+from typing import Dict, Optional
+from celery.utils.log import get_task_logger
+from sqlalchemy.orm import sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.db.session import engine
+from app.services.job_ingest.enrich import JobEnricher
+from app.core.celery_app import celery_app
+
+logger = get_task_logger(__name__)
+
+@celery_app.task(bind=True, name="app.workers.enrichment_worker.run_enrichment_task")
+def run_enrichment_task(self, limit: Optional[int] = None) -> Dict[str, int]:
+    """
+    Celery task to fetch detail pages of jobs missing a description.
+    Claims up to `limit` jobs (ENRICH_CLAIM_SIZE when omitted); claims are
+    leased, so overlapping runs work on different pages.
+    """
+    async def _run():
+        async_session_factory = sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        return await JobEnricher(async_session_factory).run_once(limit)
+
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    counts = loop.run_until_complete(_run())
+    logger.info(f"Enrichment finished: {counts}")
+    return counts
@@ -1,18 +1,52 @@
 import asyncio
+from typing import List, Optional
+from celery.signals import worker_process_init, worker_process_shutdown
 from celery.utils.log import get_task_logger
 from sqlalchemy.orm import sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.db.session import engine
 from app.services.job_ingest.pipeline import IngestPipeline
+from app.services.job_ingest.runner import IngestRunner
+from app.services.job_ingest.parallel import shutdown_process_pool
 from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.services.company_resolver import company_resolver
 
 logger = get_task_logger(__name__)
 
+@worker_process_init.connect
+def _warm_company_cache(**kwargs):
+    if not settings.COMPANY_CACHE_WARM_ON_START:
+        return
+
+    async def _warm():
+        async_session_factory = sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        async with async_session_factory() as session:
+            return await company_resolver.warm(session)
+
+    try:
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        logger.info(f"Company cache warmed with {loop.run_until_complete(_warm())} companies")
+    except Exception as exc:
+        # A cold cache only costs extra lookups
+        logger.warning(f"Company cache warm-up failed: {exc}")
+
+@worker_process_shutdown.connect
+def _shutdown_ingest_pool(**kwargs):
+    shutdown_process_pool()
+
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=60, name="app.workers.job_ingest_worker.run_ingestion_task")
-def run_ingestion_task(self, source_id: int):
+def run_ingestion_task(self, source_id: int, force_rescan: bool = False, bulk_load: Optional[bool] = None):
     """
     Celery task to run ingestion pipeline.
     Wraps async execution in synchronous Celery worker.
+    `bulk_load` overrides INGEST_BULK_LOAD (COPY-based loading for backfills).
     """
     logger.info(f"Starting ingestion for source_id: {source_id}")
     
@@ -22,8 +56,9 @@ def run_ingestion_task(self, source_id: int):
             engine, class_=AsyncSession, expire_on_commit=False
         )
         async with async_session_factory() as session:
-            pipeline = IngestPipeline(session)
-            await pipeline.run(source_id)
+            pipeline = IngestPipeline(session, bulk_load=bulk_load)
+            # The task id survives retries, so a retry resumes from the last committed chunk
+            await pipeline.run(source_id, force_rescan=force_rescan, run_key=self.request.id)
 
     try:
         # Ensure we have an event loop
@@ -41,3 +76,38 @@ def run_ingestion_task(self, source_id: int):
         # Exponential backoff: 60s, 120s, 240s...
         countdown = 60 * (2 ** self.request.retries)
         raise self.retry(exc=exc, countdown=countdown)
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60, name="app.workers.job_ingest_worker.run_due_ingestions_task")
+def run_due_ingestions_task(self, source_ids: Optional[List[int]] = None):
+    """
+    Celery task to ingest many sources concurrently on a single event loop.
+    Runs the given sources, or claims every active source that is due when omitted.
+    Failed sources are retried with backoff; the task id is the run key, so
+    a retry resumes each of them after its last committed chunk.
+    """
+    async def _run():
+        async_session_factory = sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        runner = IngestRunner(async_session_factory)
+        ids = source_ids if source_ids is not None else await runner.claim_due_source_ids()
+        logger.info(f"Starting concurrent ingestion for {len(ids)} sources")
+        return await runner.run_many(ids, run_key=self.request.id)
+
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    statuses = loop.run_until_complete(_run())
+    failed = [source_id for source_id, status in statuses.items() if status == "failed"]
+    succeeded = sum(1 for status in statuses.values() if status in ("success", "unchanged"))
+    logger.info(f"Concurrent ingestion finished: {succeeded} ok, {len(failed)} failed")
+    if failed and self.request.retries < self.max_retries:
+        # Only the failed sources; exponential backoff: 60s, 120s, 240s...
+        countdown = 60 * (2 ** self.request.retries)
+        raise self.retry(kwargs={"source_ids": failed}, countdown=countdown)
+    # Celery JSON results need string keys
+    return {str(source_id): status for source_id, status in statuses.items()}
@@ -0,0 +1,94 @@
+"""
+Normalizer throughput benchmark.
+
+Compares the substring-scan JobNormalizer against CompiledJobNormalizer on
+synthetic postings, with both the built-in tag list and a large generated
+taxonomy.
+
+    python -m benchmarks.bench_normalizer --jobs 5000 --tags 3000
+"""
+import argparse
+import json
+import os
+import random
+import string
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from app.services.job_ingest.normalizer import JobNormalizer, CompiledJobNormalizer
+
+WORDS = (
+    "we are hiring a senior engineer to build scalable services with python java react "
+    "docker kubernetes aws sql remote friendly team benefits salary equity growth platform "
+    "data pipelines customers product design ownership mentoring on-call reliability"
+).split()
+
+class SubstringTaxonomyNormalizer(JobNormalizer):
+    """The current substring scan, applied to an arbitrary tag list."""
+
+    def __init__(self, tags: List[str]):
+        self.tags = tags
+
+    def _extract_tags(self, description: str) -> List[str]:
+        desc_lower = description.lower()
+        return [tag for tag in self.tags if tag in desc_lower]
+
+def make_jobs(count: int, words_per_description: int, seed: int = 7) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        description = " ".join(rng.choice(WORDS) for _ in range(words_per_description))
+        jobs.append({
+            "title": f"Software Engineer {i}",
+            "company": f"Company {i % 300}",
+            "location": rng.choice(["New York", "Remote", "Berlin", "London"]),
+            "url": f"https://example.com/jobs/{i}",
+            "description": description + (" $120k" if i % 3 == 0 else ""),
+        })
+    return jobs
+
+def make_taxonomy(size: int, seed: int = 11) -> List[str]:
+    rng = random.Random(seed)
+    tags = set(WORDS[:12])
+    while len(tags) < size:
+        tags.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10))))
+    return sorted(tags)
+
+def measure(normalizer: JobNormalizer, jobs: List[Dict[str, Any]], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        normalizer.normalize_many(jobs)
+        best = min(best, time.perf_counter() - start)
+    return len(jobs) / best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--words", type=int, default=400, help="words per description")
+    parser.add_argument("--tags", type=int, default=3000, help="size of the large taxonomy")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.jobs, args.words)
+    taxonomy = make_taxonomy(args.tags)
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fh:
+        json.dump(taxonomy, fh)
+        taxonomy_path = fh.name
+
+    try:
+        cases = [
+            ("substring, default tags", JobNormalizer()),
+            ("compiled, default tags", CompiledJobNormalizer()),
+            (f"substring, {len(taxonomy)} tags", SubstringTaxonomyNormalizer(taxonomy)),
+            (f"compiled, {len(taxonomy)} tags", CompiledJobNormalizer(taxonomy_path)),
+        ]
+        print(f"{args.jobs} jobs, ~{args.words} words per description, best of {args.rounds}")
+        for name, normalizer in cases:
+            print(f"  {name:<28} {measure(normalizer, jobs, args.rounds):>12,.0f} jobs/sec")
+    finally:
+        os.unlink(taxonomy_path)
+
+if __name__ == "__main__":
+    main()
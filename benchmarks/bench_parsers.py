@@ -0,0 +1,174 @@
+"""
+Board HTML parsing benchmark.
+
+Compares the old BeautifulSoup(html.parser) extraction with the lxml parsers
+in app/services/scraper/parsers.py on saved Greenhouse/Lever board pages
+(or generated ones), checks that both return the same postings, and
+measures how long each keeps the event loop from running other coroutines
+when boards are parsed inline versus in a worker thread.
+
+    python -m benchmarks.bench_parsers --openings 2000
+    python -m benchmarks.bench_parsers --pages saved_boards/  # *greenhouse*.html / *lever*.html
+"""
+import argparse
+import asyncio
+import glob
+import os
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+
+from app.services.scraper.parsers import GREENHOUSE_ORIGIN, parse_greenhouse_board, parse_lever_board
+
+Parser = Callable[[str], List[Dict[str, str]]]
+
+def soup_greenhouse_board(content: str) -> List[Dict[str, str]]:
+    """GreenhouseScraper's previous extraction."""
+    soup = BeautifulSoup(content, "html.parser")
+    job_posts = soup.find_all("div", class_="opening")
+    if not job_posts:
+        job_posts = soup.find_all("section", class_="level-0")
+    postings = []
+    for post in job_posts:
+        link = post.find("a")
+        if link and link.get("href"):
+            url = link.get("href")
+            if not url.startswith("http"):
+                url = f"{GREENHOUSE_ORIGIN}{url}"
+            location = post.find("span", class_="location")
+            postings.append({
+                "title": link.get_text(strip=True),
+                "url": url,
+                "location": location.get_text(strip=True) if location else "Remote",
+            })
+    return postings
+
+def soup_lever_board(content: str) -> List[Dict[str, str]]:
+    """LeverScraper's previous extraction."""
+    soup = BeautifulSoup(content, "html.parser")
+    postings = []
+    for post in soup.find_all("a", class_="posting-title"):
+        if not post.get("href"):
+            continue
+        title = post.find("h5")
+        location = post.find("span", class_="sort-by-location")
+        postings.append({
+            "title": title.get_text(strip=True) if title else "Unknown",
+            "url": post.get("href"),
+            "location": location.get_text(strip=True) if location else "Remote",
+        })
+    return postings
+
+PARSERS: Dict[str, Tuple[Parser, Parser]] = {
+    "greenhouse": (soup_greenhouse_board, parse_greenhouse_board),
+    "lever": (soup_lever_board, parse_lever_board),
+}
+
+LOCATIONS = ["New York, NY", "Remote", "Berlin, Germany", "London, UK", "San Francisco, CA"]
+# Boards ship a lot of markup that isn't postings
+CHROME = "<script>window.__data = {};</script>" + "<div class='nav'><ul>" + "<li><a href='#'>Link</a></li>" * 40 + "</ul></div>"
+
+def make_greenhouse_board(openings: int, rng: random.Random) -> str:
+    rows = "".join(
+        f"<div class='opening' department_id='{i % 12}'>"
+        f"<a data-mapped='true' href='/acme/jobs/{4000000 + i}'>Software Engineer {i}, Platform</a>"
+        f"<span class='location'>{rng.choice(LOCATIONS)}</span></div>"
+        for i in range(openings)
+    )
+    return f"<html><head><title>Jobs at Acme</title></head><body>{CHROME}<div id='main'><section class='level-0'><h3>Engineering</h3>{rows}</section></div></body></html>"
+
+def make_lever_board(openings: int, rng: random.Random) -> str:
+    rows = "".join(
+        f"<div class='posting'><div class='posting-apply'><a class='posting-btn-submit' href='#'>Apply</a></div>"
+        f"<a class='posting-title' href='https://jobs.lever.co/acme/{i:08x}-aaaa-bbbb'>"
+        f"<h5 data-qa='posting-name'>Product Manager {i}</h5>"
+        f"<div class='posting-categories'><span class='sort-by-location posting-category'>{rng.choice(LOCATIONS)}</span>"
+        f"<span class='sort-by-team posting-category'>Product</span></div></a></div>"
+        for i in range(openings)
+    )
+    return f"<html><head><title>Acme</title></head><body>{CHROME}<div class='postings-wrapper'>{rows}</div></body></html>"
+
+def load_pages(args) -> List[Tuple[str, str, str]]:
+    """(name, board kind, html)"""
+    if args.pages:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(args.pages, "*.html"))):
+            name = os.path.basename(path)
+            kind = next((k for k in PARSERS if k in name.lower()), None)
+            if kind is None:
+                print(f"Skipping {name}: name should contain 'greenhouse' or 'lever'")
+                continue
+            with open(path, encoding="utf-8", errors="replace") as fh:
+                pages.append((name, kind, fh.read()))
+        return pages
+    rng = random.Random(7)
+    return [
+        (f"generated greenhouse ({args.openings} openings)", "greenhouse", make_greenhouse_board(args.openings, rng)),
+        (f"generated lever ({args.openings} openings)", "lever", make_lever_board(args.openings, rng)),
+    ]
+
+def best_of(parser: Parser, content: str, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        parser(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+async def max_loop_stall(parse: Callable[[], object], concurrency: int, tick: float = 0.001) -> Tuple[float, float]:
+    """Run `concurrency` parses while a ticker sleeps `tick` in a loop; returns (wall s, worst tick delay s)."""
+    worst = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal worst
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(tick)
+            worst = max(worst, time.perf_counter() - start - tick)
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(tick * 2)
+    start = time.perf_counter()
+    await asyncio.gather(*(parse() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    done = True
+    await ticking
+    return wall, worst
+
+async def loop_cases(kind: str, content: str, concurrency: int):
+    soup, lxml_parser = PARSERS[kind]
+
+    async def inline_soup():
+        soup(content)
+
+    async def threaded_lxml():
+        await asyncio.to_thread(lxml_parser, content)
+
+    for name, parse in (("bs4 inline", inline_soup), ("lxml in thread", threaded_lxml)):
+        wall, worst = await max_loop_stall(parse, concurrency)
+        print(f"    {name:<16} {concurrency} boards in {wall * 1000:8.1f} ms, worst event loop stall {worst * 1000:8.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", help="directory of saved board pages (*.html)")
+    parser.add_argument("--openings", type=int, default=2000, help="postings per generated board")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8, help="boards parsed at once in the event loop test")
+    args = parser.parse_args()
+
+    for name, kind, content in load_pages(args):
+        soup, lxml_parser = PARSERS[kind]
+        expected, actual = soup(content), lxml_parser(content)
+        match = "same postings" if expected == actual else "POSTINGS DIFFER"
+        print(f"{name}: {len(content) / 1024:.0f} KB, {len(actual)} postings, {match}")
+        soup_time = best_of(soup, content, args.rounds)
+        lxml_time = best_of(lxml_parser, content, args.rounds)
+        print(f"    bs4 html.parser  {soup_time * 1000:8.1f} ms")
+        print(f"    lxml cssselect   {lxml_time * 1000:8.1f} ms  ({soup_time / lxml_time:.1f}x)")
+        asyncio.run(loop_cases(kind, content, args.concurrency))
+
+if __name__ == "__main__":
+    main()
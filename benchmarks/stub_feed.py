@@ -0,0 +1,101 @@
+"""
+Local stub job feed for benchmarks.
+
+Serves a synthetic, offset-paginated JSON feed generated on the fly, so
+feeds of a million postings cost no memory on the server side:
+
+    GET /jobs?offset=0&limit=500  ->  {"jobs": [...]}
+
+Postings are deterministic per index. A `dup_ratio` share of them repeat
+the identity (title/company/location) of an earlier posting.
+
+    python -m benchmarks.stub_feed --postings 100000 --port 8765
+"""
+import argparse
+import json
+import multiprocessing
+import random
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict
+from urllib.parse import urlparse, parse_qs
+
+VOCABULARY = (
+    "python java react docker kubernetes aws sql fastapi remote senior engineer platform data "
+    "pipelines customers product design ownership mentoring reliability services scalable team "
+    "benefits equity growth analytics infrastructure security backend frontend mobile cloud api "
+    "testing delivery roadmap stakeholders metrics latency throughput observability incident"
+).split()
+
+CITIES = ["New York", "Berlin", "London", "Remote", "Austin", "Toronto", "Bangalore", "Paris"]
+
+def make_posting(index: int, dup_ratio: float, description_words: int) -> Dict[str, Any]:
+    rng = random.Random(index)
+    identity = index
+    if index > 0 and rng.random() < dup_ratio:
+        # Repeat the identity of an earlier posting
+        identity = rng.randrange(index)
+    id_rng = random.Random(identity * 7919)
+    return {
+        "title": f"{id_rng.choice(['Senior', 'Staff', 'Junior', 'Lead'])} Engineer {identity}",
+        "company": f"Company {identity % 5000}",
+        "location": id_rng.choice(CITIES),
+        "url": f"https://jobs.example.com/{index}",
+        "description": " ".join(rng.choice(VOCABULARY) for _ in range(description_words)),
+        "salary_text": f"${rng.randint(60, 250)}k",
+    }
+
+def make_handler(postings: int, dup_ratio: float, description_words: int):
+    class FeedHandler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != "/jobs":
+                self.send_response(404)
+                self.end_headers()
+                return
+            query = parse_qs(url.query)
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", ["500"])[0])
+            jobs = [
+                make_posting(i, dup_ratio, description_words)
+                for i in range(offset, min(offset + limit, postings))
+            ]
+            body = json.dumps({"jobs": jobs}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return FeedHandler
+
+def serve(port: int, postings: int, dup_ratio: float, description_words: int, ready=None):
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(postings, dup_ratio, description_words))
+    if ready is not None:
+        ready.put(server.server_port)
+    server.serve_forever()
+
+def start_in_background(postings: int, dup_ratio: float, description_words: int):
+    """Run the feed in a child process (kept out of the benchmark's RSS). Returns (process, base_url)."""
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=serve, args=(0, postings, dup_ratio, description_words, ready), daemon=True
+    )
+    process.start()
+    port = ready.get(timeout=30)
+    return process, f"http://127.0.0.1:{port}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--postings", type=int, default=10000)
+    parser.add_argument("--dup-ratio", type=float, default=0.2)
+    parser.add_argument("--description-words", type=int, default=300)
+    args = parser.parse_args()
+    print(f"Serving {args.postings} postings on http://127.0.0.1:{args.port}/jobs")
+    serve(args.port, args.postings, args.dup_ratio, args.description_words)
+
+if __name__ == "__main__":
+    main()
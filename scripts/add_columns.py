@@ -0,0 +1,149 @@
+"""
+Add columns introduced after a table was first created.
+
+There are no migrations and init_db's create_all never alters existing
+tables, so databases created by an older release are missing these columns
+and fail on the first query that selects them. Also fills company.name_key
+for existing companies before making it unique. Safe to re-run: columns and
+indexes that already exist are skipped.
+
+    python -m scripts.add_columns
+"""
+import asyncio
+from typing import Dict, List, Tuple
+
+from sqlalchemy import bindparam, inspect, select, text, update
+
+import app.models # noqa: F401 - register every table for init_db
+from app.db.session import engine, init_db
+from app.models.company import Company
+from app.services.company_resolver import company_key
+
+# table -> [(column, SQL type / default)]
+COLUMNS: Dict[str, List[Tuple[str, str]]] = {
+    # Conditional fetch validators (ETag / Last-Modified / body digest)
+    "jobsource": [
+        ("etag", "VARCHAR"),
+        ("last_modified", "VARCHAR"),
+        ("content_digest", "VARCHAR"),
+        # Adaptive scheduling
+        ("current_interval_minutes", "INTEGER"),
+        ("next_run_at", "TIMESTAMP"),
+    ],
+    # Cold payload store digests (scripts/backfill_payloads.py moves existing payloads)
+    "job": [
+        ("description_digest", "VARCHAR"),
+        ("raw_data_digest", "VARCHAR"),
+    ],
+    # Normalized name the company resolver matches on
+    "company": [
+        ("name_key", "VARCHAR"),
+    ],
+    # Per-stage timings and I/O counters
+    "ingestionlog": [
+        ("fetch_seconds", "FLOAT NOT NULL DEFAULT 0"),
+        ("normalize_seconds", "FLOAT NOT NULL DEFAULT 0"),
+        ("dedup_seconds", "FLOAT NOT NULL DEFAULT 0"),
+        ("persist_seconds", "FLOAT NOT NULL DEFAULT 0"),
+        ("commit_seconds", "FLOAT NOT NULL DEFAULT 0"),
+        ("bytes_fetched", "BIGINT NOT NULL DEFAULT 0"),
+        ("pages_fetched", "INTEGER NOT NULL DEFAULT 0"),
+        ("db_round_trips", "INTEGER NOT NULL DEFAULT 0"),
+    ],
+}
+
+# (index name, table, column or expression)
+INDEXES: List[Tuple[str, str, str]] = [
+    ("ix_jobsource_next_run_at", "jobsource", "next_run_at"),
+    ("ix_company_name_lower", "company", "lower(name)"),
+]
+
+# Created once the columns they cover are backfilled
+UNIQUE_INDEXES: List[Tuple[str, str, str]] = [
+    ("uq_company_name_key", "company", "name_key"),
+]
+
+# Superseded by a unique index above
+DROPPED_INDEXES: List[str] = ["ix_company_name_key"]
+
+async def add_columns():
+    async with engine.begin() as conn:
+        for table, columns in COLUMNS.items():
+            existing = await conn.run_sync(
+                lambda sync_conn: {c["name"] for c in inspect(sync_conn).get_columns(table)}
+            )
+            for column, ddl in columns:
+                if column not in existing:
+                    await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+                    print(f"Added {table}.{column}")
+        for name, table, column in INDEXES:
+            await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})"))
+
+async def backfill_company_keys(batch_size: int = 1000):
+    """
+    Fill company.name_key for rows created before the column existed. A key
+    stays with the company already holding it, or goes to the oldest company
+    with that name; the others keep a NULL key and resolve to that company.
+    """
+    table = Company.__table__
+    older = table.alias("older")
+    stmt = update(table).where(table.c.id == bindparam("_id")).values(name_key=bindparam("name_key"))
+    async with engine.begin() as conn:
+        # Keys filled before they were unique stay on the oldest row only
+        result = await conn.execute(
+            update(table)
+            .where(table.c.name_key != None)
+            .where(
+                select(older.c.id)
+                .where(older.c.name_key == table.c.name_key)
+                .where(older.c.id < table.c.id)
+                .exists()
+            )
+            .values(name_key=None)
+        )
+        if result.rowcount:
+            print(f"Cleared company.name_key on {result.rowcount} duplicate companies")
+
+        filled = 0
+        last_id = 0
+        while True:
+            result = await conn.execute(
+                select(table.c.id, table.c.name)
+                .where(table.c.name_key == None)
+                .where(table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            ids_by_key: Dict[str, int] = {}
+            for company_id, name in rows:
+                ids_by_key.setdefault(company_key(name), company_id)
+            taken = await conn.execute(select(table.c.name_key).where(table.c.name_key.in_(list(ids_by_key))))
+            for key in taken.scalars():
+                ids_by_key.pop(key, None)
+            if ids_by_key:
+                await conn.execute(stmt, [{"_id": company_id, "name_key": key} for key, company_id in ids_by_key.items()])
+                filled += len(ids_by_key)
+    if filled:
+        print(f"Filled company.name_key for {filled} companies")
+
+async def add_unique_indexes():
+    async with engine.begin() as conn:
+        for name in DROPPED_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        for name, table, column in UNIQUE_INDEXES:
+            await conn.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS {name} ON {table} ({column})"))
+
+async def main():
+    # New tables first; create_all leaves existing ones alone
+    await init_db()
+    await add_columns()
+    await backfill_company_keys()
+    await add_unique_indexes()
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""
+Move existing job descriptions and raw postings into the cold payload store.
+
+Rewrites jobs in id order, batch by batch, committing after each batch.
+The digest columns and the payloadblob table come from scripts/add_columns.py,
+which this runs first. Safe to re-run: rows already offloaded are skipped.
+
+    python -m scripts.backfill_payloads --batch-size 1000
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import bindparam, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+import app.models # noqa: F401 - register every table for init_db
+from app.db.session import engine, init_db
+from app.models.job import Job
+from app.services.payload_store import payload_store
+from scripts.add_columns import add_columns
+
+DIGEST_COLUMNS = ("description_digest", "raw_data_digest")
+
+async def backfill(batch_size: int) -> int:
+    table = Job.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("_id"))
+        .values(
+            description=bindparam("description"),
+            raw_data=bindparam("raw_data"),
+            description_digest=bindparam("description_digest"),
+            raw_data_digest=bindparam("raw_data_digest"),
+        )
+    )
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    last_id, moved = 0, 0
+    async with async_session() as session:
+        while True:
+            result = await session.execute(
+                select(table.c.id, table.c.description, table.c.raw_data, *(table.c[c] for c in DIGEST_COLUMNS))
+                .where(table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            )
+            batch = result.mappings().all()
+            if not batch:
+                return moved
+            last_id = batch[-1]["id"]
+
+            rows = [dict(row) for row in batch]
+            blobs = payload_store.offload(rows)
+            # offload() only touches rows that still carry large payloads
+            changed = [
+                {"_id": row["id"], **{k: row[k] for k in ("description", "raw_data", *DIGEST_COLUMNS)}}
+                for row, before in zip(rows, batch)
+                if any(row[c] != before[c] for c in DIGEST_COLUMNS)
+            ]
+            if changed:
+                await payload_store.save(session, blobs)
+                await session.execute(stmt, changed)
+                await session.commit()
+                moved += len(changed)
+            print(f"Up to job {last_id}: {moved} jobs moved")
+
+async def main(batch_size: int):
+    await init_db()
+    await add_columns()
+    start = time.perf_counter()
+    moved = await backfill(batch_size)
+    print(f"Done: {moved} jobs moved in {time.perf_counter() - start:.1f}s")
+    await engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.batch_size))
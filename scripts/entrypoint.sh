@@ -7,6 +7,10 @@ set -e
 # Run migrations
 # alembic upgrade head
 # For now, using init_db script logic if accessible, or relying on app startup
+# Columns added to existing tables (create_all doesn't alter them)
+if [ "$1" = 'backend' ]; then
+    python -m scripts.add_columns
+fi
 
 # Start application
 if [ "$1" = 'backend' ]; then